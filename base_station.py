@@ -10,43 +10,105 @@ import logging
 import yaml
 import time
 import os
+import threading
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
 
 from gps_serial import LC29HSerial
 from ntrip_server import NTRIPServer
-from rtcm_parser import RTCM3Parser, RTCMMessageBuffer
+from rtcm_parser import RTCM3Parser
 from web_interface import WebInterface
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    _YAMLLoader = yaml.SafeLoader
+
+# Bound once so the per-frame path skips the RTCM3Parser attribute lookups
+_RTCM_KNOWN_TYPES = frozenset(RTCM3Parser.MESSAGE_TYPES)
+_validate_rtcm = RTCM3Parser.validate_message
+
 
 class RTKBaseStation:
     """RTK Base Station coordinator"""
 
-    def __init__(self, config_file: str = 'config.yaml'):
+    __slots__ = (
+        'config', 'logger', 'gps', 'ntrip', 'web', 'running',
+        'rtcm_pending', 'rtcm_pending_lock', 'flush_thread', 'flush_event',
+        '_rtcm_msgs', '_bytes_broadcast', '_start_time', '_start_monotonic', '_cached_ip',
+        '_log_counter', '_batch_max_bytes'
+    )
+
+    def __init__(self, config_file: str = 'config.yaml', config: dict = None):
         """
         Initialize RTK base station
 
         Args:
             config_file: Path to configuration file
+            config: Already-parsed configuration (skips reading config_file)
         """
-        self.config = self._load_config(config_file)
+        self.config = config if config is not None else self._load_config(config_file)
         self.logger = self._setup_logging()
         self.gps = None
         self.ntrip = None
         self.web = None
         self.running = False
-        self.rtcm_buffer = RTCMMessageBuffer()
-        self.stats = {
-            'rtcm_messages': 0,
-            'bytes_broadcast': 0,
-            'start_time': None
-        }
-
-    def _load_config(self, config_file: str) -> dict:
+        self.rtcm_pending = bytearray()
+        self.rtcm_pending_lock = threading.Lock()
+        self.flush_thread = None
+        self.flush_event = threading.Event()
+        self._rtcm_msgs = 0
+        self._bytes_broadcast = 0
+        self._start_time = None
+        self._start_monotonic = None
+        self._cached_ip = None
+        self._log_counter = 0
+        # Read once; compared against on every RTCM frame
+        self._batch_max_bytes = self.config.get('rtcm', {}).get('batch_max_bytes', 4096)
+
+    def snapshot(self) -> tuple:
+        """
+        Session counters read together
+
+        Returns:
+            Tuple of (rtcm_messages, bytes_broadcast, start_time, start_monotonic)
+        """
+        # The counters are bumped under rtcm_pending_lock along with the
+        # frame append, so one acquisition here sees a matching pair
+        with self.rtcm_pending_lock:
+            return self._rtcm_msgs, self._bytes_broadcast, self._start_time, self._start_monotonic
+
+    def collect_all(self) -> tuple:
+        """
+        Everything the status API reports about the base station, in one pass
+
+        Returns:
+            Tuple of (status, rtcm_messages, bytes_broadcast, start_time,
+            start_monotonic, active_clients, gps_status)
+        """
+        rtcm_messages, bytes_broadcast, start_time, start_monotonic = self.snapshot()
+        ntrip = self.ntrip
+        gps = self.gps
+
+        return (
+            'running' if self.running else 'stopped',
+            rtcm_messages,
+            bytes_broadcast,
+            start_time,
+            start_monotonic,
+            # Client details are served separately by /api/clients
+            len(ntrip.clients) if ntrip else 0,
+            gps.get_gps_status() if gps else
+            {'satellites': 0, 'fix_type': 'Unknown', 'hdop': 0.0, 'stale': True}
+        )
+
+    @staticmethod
+    def _load_config(config_file: str) -> dict:
         """Load configuration from YAML file"""
         try:
             with open(config_file, 'r') as f:
-                return yaml.safe_load(f)
+                return yaml.load(f, Loader=_YAMLLoader)
         except FileNotFoundError:
             print(f"Error: Configuration file '{config_file}' not found")
             sys.exit(1)
@@ -110,7 +172,8 @@ class RTKBaseStation:
         self.gps = LC29HSerial(
             port=serial_config['port'],
             baudrate=serial_config['baudrate'],
-            timeout=serial_config.get('timeout', 1.0)
+            timeout=serial_config.get('timeout', 1.0),
+            realtime_priority=serial_config.get('realtime_priority', 0)
         )
 
         if not self.gps.connect():
@@ -180,14 +243,22 @@ class RTKBaseStation:
             return False
 
         self.running = True
-        self.stats['start_time'] = time.time()
+        self._start_time = time.time()
+        self._start_monotonic = time.monotonic()
+
+        # Start RTCM batch flushing
+        self.flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self.flush_thread.start()
 
         # Start web interface
         web_config = self.config.get('web', {})
         if web_config.get('enabled', True):
             web_host = web_config.get('host', '0.0.0.0')
             web_port = web_config.get('port', 5000)
-            self.web = WebInterface(self, host=web_host, port=web_port)
+            self.web = WebInterface(
+                self, host=web_host, port=web_port,
+                status_interval=web_config.get('status_refresh_interval', 0.5)
+            )
             self.web.start()
             self.logger.info(f"Web interface available at http://{self._get_ip_address()}:{web_port}")
 
@@ -204,6 +275,14 @@ class RTKBaseStation:
         self.logger.info("Stopping RTK Base Station...")
         self.running = False
 
+        if self.flush_thread:
+            self.flush_event.set()
+            self.flush_thread.join(timeout=2.0)
+        self._flush_rtcm()
+
+        if self.web:
+            self.web.stop()
+
         if self.ntrip:
             self.ntrip.stop()
 
@@ -213,58 +292,116 @@ class RTKBaseStation:
         self._print_stats()
         self.logger.info("RTK Base Station stopped")
 
-    def _handle_rtcm_data(self, rtcm_data: bytes):
+    def _handle_rtcm_data(self, rtcm_data: memoryview):
         """
         Handle RTCM data received from GPS
 
         Args:
-            rtcm_data: RTCM3 message bytes
+            rtcm_data: RTCM3 message, a view only valid during this call
         """
-        # Validate message
-        is_valid, msg_type, msg_len = RTCM3Parser.validate_message(rtcm_data)
+        # LC29HSerial only delivers frames whose CRC24Q has already been
+        # verified, so a header sanity check is enough here
+        frame_len = len(rtcm_data)
+        if (frame_len >= 6 and rtcm_data[0] == 0xD3 and
+                (((rtcm_data[1] & 0x03) << 8) | rtcm_data[2]) + 6 == frame_len):
+            is_valid = True
+        else:
+            is_valid, msg_type, _ = _validate_rtcm(rtcm_data)
 
         if is_valid:
-            # Broadcast to NTRIP clients
+            # Queue for the next batched broadcast to NTRIP clients
+            # The serial reader thread only appends; socket writes happen on
+            # the flush thread so a slow client never stalls the GPS read
             if self.ntrip:
-                self.ntrip.broadcast_rtcm(rtcm_data)
-                self.stats['rtcm_messages'] += 1
-                self.stats['bytes_broadcast'] += len(rtcm_data)
+                with self.rtcm_pending_lock:
+                    self.rtcm_pending += rtcm_data
+                    pending = len(self.rtcm_pending)
+                    self._rtcm_msgs += 1
+                    self._bytes_broadcast += frame_len
+                if pending >= self._batch_max_bytes:
+                    self.flush_event.set()
 
                 # Log message info periodically
-                if self.stats['rtcm_messages'] % 100 == 0:
-                    self.logger.debug(
-                        f"RTCM stats - Messages: {self.stats['rtcm_messages']}, "
-                        f"Bytes: {self.stats['bytes_broadcast']}, "
-                        f"Clients: {len(self.ntrip.clients)}"
-                    )
+                self._log_counter += 1
+                if self._log_counter == 100:
+                    self._log_counter = 0
+                    if self.logger.isEnabledFor(logging.DEBUG):
+                        self.logger.debug(
+                            "RTCM stats - Messages: %d, Bytes: %d, Clients: %d",
+                            self._rtcm_msgs, self._bytes_broadcast, len(self.ntrip.clients)
+                        )
         else:
             # Only log warnings for recognized message types (not noise/partial data)
-            if msg_type > 0 and msg_type in RTCM3Parser.MESSAGE_TYPES:
-                self.logger.warning(f"Invalid RTCM message received, type {msg_type}")
+            if msg_type > 0 and msg_type in _RTCM_KNOWN_TYPES:
+                self.logger.warning("Invalid RTCM message received, type %d", msg_type)
+
+    def _flush_rtcm(self):
+        """Broadcast any queued RTCM frames as a single write per client"""
+        # Swap in an empty buffer rather than copying the batch out, so the
+        # lock is held only for the swap and the frames are copied just once
+        # (from the serial read into rtcm_pending)
+        with self.rtcm_pending_lock:
+            if not self.rtcm_pending:
+                return
+            batch = self.rtcm_pending
+            self.rtcm_pending = bytearray()
+        if self.ntrip:
+            self.ntrip.broadcast_rtcm(batch)
+
+    def _flush_loop(self):
+        """
+        Background thread flushing queued RTCM frames
+
+        RTCM3 frames are self-delimiting (0xD3 preamble, length, CRC), so
+        frames arriving within one batch window can be concatenated and
+        sent to each client with one write instead of one per frame.
+        """
+        window = self.config['rtcm'].get('batch_window', 0.05)
+        while self.running:
+            # Woken early when the pending batch reaches batch_max_bytes
+            self.flush_event.wait(window)
+            self.flush_event.clear()
+            # Nothing to coalesce for when nobody is listening
+            if self.ntrip and not self.ntrip.clients:
+                with self.rtcm_pending_lock:
+                    self.rtcm_pending.clear()
+                continue
+            self._flush_rtcm()
 
     def _print_stats(self):
         """Print session statistics"""
-        if self.stats['start_time']:
-            uptime = time.time() - self.stats['start_time']
+        if self._start_monotonic:
+            uptime = time.monotonic() - self._start_monotonic
             self.logger.info("Session Statistics:")
             self.logger.info(f"  Uptime: {uptime:.1f} seconds ({uptime/3600:.2f} hours)")
-            self.logger.info(f"  RTCM Messages: {self.stats['rtcm_messages']}")
-            self.logger.info(f"  Bytes Broadcast: {self.stats['bytes_broadcast']}")
+            self.logger.info(f"  RTCM Messages: {self._rtcm_msgs}")
+            self.logger.info(f"  Bytes Broadcast: {self._bytes_broadcast}")
             if uptime > 0:
-                self.logger.info(f"  Avg Rate: {self.stats['rtcm_messages']/uptime:.2f} msg/sec")
+                self.logger.info(f"  Avg Rate: {self._rtcm_msgs/uptime:.2f} msg/sec")
 
     def _get_ip_address(self) -> str:
-        """Get system IP address for display"""
+        """Get system IP address for display (probed once, then cached)"""
+        if self._cached_ip:
+            return self._cached_ip
+
         import socket
         try:
             # Connect to external address to determine local IP
             s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            ip = s.getsockname()[0]
-            s.close()
-            return ip
-        except:
-            return "localhost"
+            s.settimeout(0.5)
+            try:
+                s.connect(("8.8.8.8", 80))
+                ip = s.getsockname()[0]
+            finally:
+                s.close()
+        except OSError:
+            try:
+                ip = socket.gethostbyname(socket.gethostname())
+            except OSError:
+                ip = "localhost"
+
+        self._cached_ip = ip
+        return ip
 
     def run(self):
         """Main run loop"""
@@ -282,16 +419,19 @@ class RTKBaseStation:
 
         # Status update loop
         try:
+            next_tick = time.monotonic() + 10
             while self.running:
-                time.sleep(10)
+                # Sleep to a fixed cadence so a slow status print doesn't drift it
+                time.sleep(max(0.0, next_tick - time.monotonic()))
+                next_tick += 10
 
                 # Print status update
                 if self.ntrip:
                     stats = self.ntrip.get_stats()
                     if stats['active_clients'] > 0:
                         self.logger.info(
-                            f"Active clients: {stats['active_clients']}, "
-                            f"RTCM messages sent: {self.stats['rtcm_messages']}"
+                            "Active clients: %d, RTCM messages sent: %d",
+                            stats['active_clients'], self._rtcm_msgs
                         )
 
         except KeyboardInterrupt:
@@ -339,9 +479,11 @@ For more information, see the README.md file.
 
     args = parser.parse_args()
 
+    # Parse configuration once for both the serial check and the base station
+    config = RTKBaseStation._load_config(args.config)
+
     # Check serial port if requested
     if args.check_serial:
-        config = yaml.safe_load(open(args.config))
         port = config['serial']['port']
         if os.path.exists(port):
             print(f"✓ Serial port {port} exists")
@@ -357,13 +499,15 @@ For more information, see the README.md file.
         else:
             print(f"✗ Serial port {port} does not exist")
             print(f"  Available serial ports:")
-            for dev in Path('/dev').glob('tty*'):
-                if 'ttyS' in str(dev) or 'ttyAMA' in str(dev) or 'USB' in str(dev):
-                    print(f"    {dev}")
+            with os.scandir('/dev') as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(('ttyS', 'ttyAMA')) or (name.startswith('tty') and 'USB' in name):
+                        print(f"    /dev/{name}")
             return 1
 
     # Run base station
-    base_station = RTKBaseStation(args.config)
+    base_station = RTKBaseStation(args.config, config=config)
 
     # Override web interface setting if --no-web flag is provided
     if args.no_web:
@@ -6,6 +6,11 @@ Convert ECEF coordinates to Latitude, Longitude, Altitude (WGS84)
 import math
 import sys
 
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional; only ecef_to_lla_batch uses it
+    np = None
+
 def ecef_to_lla(x, y, z):
     """
     Convert ECEF (Earth-Centered, Earth-Fixed) coordinates to
@@ -17,27 +22,27 @@ def ecef_to_lla(x, y, z):
     Returns:
         tuple: (latitude_deg, longitude_deg, altitude_m)
     """
+    sin, cos, sqrt, atan2 = math.sin, math.cos, math.sqrt, math.atan2
+
     # WGS84 ellipsoid constants
     a = 6378137.0  # Semi-major axis (equatorial radius) in meters
     f = 1 / 298.257223563  # Flattening
     e2 = 2 * f - f * f  # First eccentricity squared
+    b = a * (1 - f)  # Semi-minor axis (polar radius) in meters
+    ep2 = (a * a - b * b) / (b * b)  # Second eccentricity squared
 
     # Calculate longitude
-    lon = math.atan2(y, x)
-
-    # Calculate latitude and altitude iteratively
-    p = math.sqrt(x * x + y * y)
-    lat = math.atan2(z, p * (1 - e2))
+    lon = atan2(y, x)
 
-    # Iterate to improve accuracy
-    for _ in range(5):
-        N = a / math.sqrt(1 - e2 * math.sin(lat) * math.sin(lat))
-        alt = p / math.cos(lat) - N
-        lat = math.atan2(z, p * (1 - e2 * N / (N + alt)))
+    # Calculate latitude with Bowring's closed-form approximation
+    p = math.hypot(x, y)
+    theta = atan2(z * a, p * b)
+    lat = atan2(z + ep2 * b * sin(theta) ** 3,
+                p - e2 * a * cos(theta) ** 3)
 
-    # Final altitude calculation
-    N = a / math.sqrt(1 - e2 * math.sin(lat) * math.sin(lat))
-    alt = p / math.cos(lat) - N
+    # Altitude above the ellipsoid
+    N = a / sqrt(1 - e2 * sin(lat) ** 2)
+    alt = p / cos(lat) - N
 
     # Convert to degrees
     lat_deg = math.degrees(lat)
@@ -46,6 +51,47 @@ def ecef_to_lla(x, y, z):
     return lat_deg, lon_deg, alt
 
 
+def ecef_to_lla_batch(xyz):
+    """
+    Convert many ECEF points to WGS84 Latitude, Longitude, Altitude at once
+
+    Uses the same Bowring formulation as ecef_to_lla(), vectorized with
+    NumPy. Without NumPy installed it falls back to calling ecef_to_lla()
+    per point.
+
+    Args:
+        xyz: Sequence or (N, 3) array of ECEF coordinates in meters
+
+    Returns:
+        list: (latitude_deg, longitude_deg, altitude_m) tuples of floats,
+        one per point, whether or not NumPy is available
+    """
+    if np is None:
+        return [ecef_to_lla(x, y, z) for x, y, z in xyz]
+
+    xyz = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+    x, y, z = xyz[:, 0], xyz[:, 1], xyz[:, 2]
+
+    # WGS84 ellipsoid constants
+    a = 6378137.0
+    f = 1 / 298.257223563
+    e2 = 2 * f - f * f
+    b = a * (1 - f)
+    ep2 = (a * a - b * b) / (b * b)
+
+    lon = np.arctan2(y, x)
+
+    p = np.hypot(x, y)
+    theta = np.arctan2(z * a, p * b)
+    lat = np.arctan2(z + ep2 * b * np.sin(theta) ** 3,
+                     p - e2 * a * np.cos(theta) ** 3)
+
+    N = a / np.sqrt(1 - e2 * np.sin(lat) ** 2)
+    alt = p / np.cos(lat) - N
+
+    return list(zip(np.degrees(lat).tolist(), np.degrees(lon).tolist(), alt.tolist()))
+
+
 if __name__ == "__main__":
     if len(sys.argv) != 4:
         print("Usage: python3 ecef_to_lla.py <X> <Y> <Z>")
@@ -9,6 +9,19 @@ import time
 import sys
 import argparse
 
+# NMEA sentence prefixes of interest (talker + sentence type)
+_GGA_PREFIXES = frozenset(('$GNGGA', '$GPGGA'))
+_GSV_PREFIXES = frozenset(('$GNGSV', '$GPGSV'))
+
+# GGA fix quality indicator descriptions
+_FIX_TYPES = {
+    '0': 'No Fix',
+    '1': 'GPS Fix',
+    '2': 'DGPS Fix',
+    '4': 'RTK Fixed',
+    '5': 'RTK Float'
+}
+
 def test_serial_connection(port='/dev/ttyS0', baudrate=115200, duration=5):
     """
     Test serial connection and display incoming data
@@ -32,36 +45,35 @@ def test_serial_connection(port='/dev/ttyS0', baudrate=115200, duration=5):
         nmea_count = 0
         rtcm_count = 0
         total_bytes = 0
-        start_time = time.time()
+        start_time = time.monotonic()
 
         print("Receiving data:\n")
 
-        while time.time() - start_time < duration:
-            if ser.in_waiting > 0:
-                data = ser.read(ser.in_waiting)
-                total_bytes += len(data)
-
-                # Try to decode as text (NMEA)
-                try:
-                    text = data.decode('ascii', errors='ignore')
-                    lines = text.split('\n')
-                    for line in lines:
-                        if line.startswith('$'):
-                            nmea_count += 1
-                            # Print first few NMEA sentences
-                            if nmea_count <= 5:
-                                print(f"  NMEA: {line.strip()}")
-                except:
-                    pass
-
-                # Check for RTCM (binary starting with 0xD3)
-                for i in range(len(data)):
-                    if data[i] == 0xD3:
-                        rtcm_count += 1
-                        if rtcm_count <= 3:
-                            print(f"  RTCM: Detected binary message starting at byte {i}")
-
-            time.sleep(0.1)
+        while time.monotonic() - start_time < duration:
+            # Blocks in the kernel until data arrives, then drains what is buffered
+            data = ser.read(ser.in_waiting or 1)
+            if not data:
+                continue
+            total_bytes += len(data)
+
+            # Look for NMEA sentences (ASCII lines starting with $); pure
+            # RTCM chunks skip the line split entirely
+            if b'$' in data:
+                for raw_line in data.split(b'\n'):
+                    if raw_line.startswith(b'$'):
+                        nmea_count += 1
+                        # Print first few NMEA sentences
+                        if nmea_count <= 5:
+                            print(f"  NMEA: {raw_line.strip().decode('ascii', errors='ignore')}")
+
+            # Check for RTCM (binary starting with 0xD3)
+            pos = data.find(b'\xd3')
+            while pos != -1 and rtcm_count < 3:
+                rtcm_count += 1
+                print(f"  RTCM: Detected binary message starting at byte {pos}")
+                pos = data.find(b'\xd3', pos + 1)
+            if pos != -1:
+                rtcm_count += data.count(b'\xd3', pos)
 
         ser.close()
 
@@ -69,7 +81,7 @@ def test_serial_connection(port='/dev/ttyS0', baudrate=115200, duration=5):
         print("\nDiagnostic Results:")
         print("=" * 70)
 
-        elapsed = time.time() - start_time
+        elapsed = time.monotonic() - start_time
 
         if total_bytes == 0:
             print("❌ NO DATA RECEIVED")
@@ -134,59 +146,55 @@ def check_satellite_info(port='/dev/ttyS0', baudrate=115200, duration=10):
 
     try:
         ser = serial.Serial(port, baudrate, timeout=1)
-        buffer = ""
-        start_time = time.time()
+        tail = b''
+        start_time = time.monotonic()
 
         gga_found = False
         gsv_found = False
 
-        while time.time() - start_time < duration:
-            if ser.in_waiting > 0:
-                data = ser.read(ser.in_waiting).decode('ascii', errors='ignore')
-                buffer += data
-
-                while '\n' in buffer:
-                    line, buffer = buffer.split('\n', 1)
-                    line = line.strip()
-
-                    # GGA - Position and fix data
-                    if line.startswith('$GNGGA') or line.startswith('$GPGGA'):
+        while time.monotonic() - start_time < duration:
+            chunk = ser.read(ser.in_waiting or 1)
+            if not chunk:
+                continue
+
+            # Split complete sentences as bytes, carrying the partial tail over
+            lines = (tail + chunk).split(b'\n')
+            tail = lines.pop()
+
+            for raw in lines:
+                line = raw.decode('ascii', errors='ignore').strip()
+                prefix = line[:6]
+
+                # GGA - Position and fix data
+                if prefix in _GGA_PREFIXES:
+                    parts = line.split(',')
+                    if len(parts) > 9:
+                        fix = parts[6]
+                        sats = parts[7]
+                        hdop = parts[8]
+                        alt = parts[9]
+
+                        fix_type = _FIX_TYPES.get(fix, f'Unknown ({fix})')
+
+                        if not gga_found:
+                            print(f"Position Fix Quality: {fix_type}")
+                            print(f"Satellites in use: {sats}")
+                            print(f"HDOP: {hdop}")
+                            print(f"Altitude: {alt} m")
+                            gga_found = True
+
+                # GSV - Satellites in view
+                elif prefix in _GSV_PREFIXES:
+                    if not gsv_found:
                         parts = line.split(',')
-                        if len(parts) > 9:
-                            fix = parts[6]
-                            sats = parts[7]
-                            hdop = parts[8]
-                            alt = parts[9]
-
-                            fix_type = {
-                                '0': 'No Fix',
-                                '1': 'GPS Fix',
-                                '2': 'DGPS Fix',
-                                '4': 'RTK Fixed',
-                                '5': 'RTK Float'
-                            }.get(fix, f'Unknown ({fix})')
-
-                            if not gga_found:
-                                print(f"Position Fix Quality: {fix_type}")
-                                print(f"Satellites in use: {sats}")
-                                print(f"HDOP: {hdop}")
-                                print(f"Altitude: {alt} m")
-                                gga_found = True
-
-                    # GSV - Satellites in view
-                    if line.startswith('$GNGSV') or line.startswith('$GPGSV'):
-                        if not gsv_found:
-                            parts = line.split(',')
-                            if len(parts) > 3:
-                                total_sats = parts[3]
-                                print(f"\nSatellites in view: {total_sats}")
-                                gsv_found = True
+                        if len(parts) > 3:
+                            total_sats = parts[3]
+                            print(f"\nSatellites in view: {total_sats}")
+                            gsv_found = True
 
             if gga_found and gsv_found:
                 break
 
-            time.sleep(0.1)
-
         ser.close()
 
         if not gga_found:
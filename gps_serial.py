@@ -6,17 +6,79 @@ Handles serial communication with Quectel LC29H GNSS RTK module
 
 import serial
 import logging
+import math
+import os
+import re
+import select
 from typing import Optional, Callable
 import threading
 import time
+import struct
+from functools import reduce
+from operator import xor
+
+from rtcm_parser import RTCM3Parser
 
 logger = logging.getLogger(__name__)
 
+_calc_crc24q = RTCM3Parser._calc_crc24q
+
+# Largest RTCM3 frame: 3 header + 1023 payload + 3 CRC24
+_RTCM_MAX_FRAME = 1029
+# RTCM3 header after the preamble: 6 reserved bits + 10-bit payload length
+_RTCM_HEADER = struct.Struct('>xH')
+# First two payload bytes; the message type is the top 12 bits
+_RTCM_TYPE = struct.Struct('>3xH')
+# NMEA allows 82 characters; leave room for longer proprietary replies
+_NMEA_MAX_SENTENCE = 256
+# Upper bound for one serial read; a 1 Hz RTCM burst fits in one read
+_READ_SIZE = 4096
+# GGA fields 2-9: lat, N/S, lon, E/W, fix quality, satellites, HDOP, altitude
+_GGA_RE = re.compile(
+    r'\$..GGA,[^,]*,([^,]*),([NS]?),([^,]*),([EW]?),([^,]*),([^,]*),([^,]*),([^,]*),'
+)
+
+# Field names for the GPS status snapshot tuple
+_STATUS_FIELDS = (
+    'satellites', 'fix_quality', 'fix_type', 'hdop',
+    'last_update', 'current_lat', 'current_lon', 'current_alt'
+)
+
+# GGA fix quality indicator descriptions, indexed by the indicator value
+_FIX_TYPES = (
+    'No Fix',          # 0
+    'GPS Fix',         # 1
+    'DGPS Fix',        # 2
+    None,              # 3 (PPS, not reported by LC29H)
+    'RTK Fixed',       # 4
+    'RTK Float',       # 5
+    'Dead Reckoning'   # 6
+)
+
+
+def _nmea_checksum(sentence: str) -> str:
+    """Calculate NMEA checksum (XOR of all characters between $ and *)"""
+    return f"{reduce(xor, sentence.encode('ascii'), 0):02X}"
+
+
+def _nmea_command(sentence: str) -> bytes:
+    """Frame a command body as $<sentence>*<checksum>\\r\\n"""
+    return f"${sentence}*{_nmea_checksum(sentence)}\r\n".encode('ascii')
+
+
+# Fixed configuration commands, framed once at import
+_CMD_RCVRMODE_BASE = _nmea_command("PQTMCFGRCVRMODE,W,2")  # Write, mode 2 (base station)
+_CMD_SAVEPAR = _nmea_command("PQTMSAVEPAR")
+_CMD_RTCM_MSM4 = _nmea_command("PAIR432,1")  # Enable RTCM3 MSM4 output
+_CMD_RTCM_1005 = _nmea_command("PAIR434,1")  # Enable RTCM3 1005 antenna position
+_CMD_NMEA_GGA = _nmea_command("PAIR062,0,01")  # Enable NMEA GGA output
+
 
 class LC29HSerial:
     """Handle serial communication with LC29H GPS module"""
 
-    def __init__(self, port: str = '/dev/ttyUSB0', baudrate: int = 115200, timeout: float = 1.0):
+    def __init__(self, port: str = '/dev/ttyUSB0', baudrate: int = 115200, timeout: float = 1.0,
+                 realtime_priority: int = 0):
         """
         Initialize LC29H serial connection
 
@@ -24,30 +86,36 @@ class LC29HSerial:
             port: Serial port device path
             baudrate: Communication speed (default 115200 for LC29H)
             timeout: Read timeout in seconds
+            realtime_priority: SCHED_FIFO priority (1-99) for the reader
+                thread, or 0 to keep normal scheduling
         """
         self.port = port
         self.baudrate = baudrate
         self.timeout = timeout
+        self.realtime_priority = realtime_priority
         self.serial_conn: Optional[serial.Serial] = None
         self.running = False
         self.read_thread: Optional[threading.Thread] = None
-        self.rtcm_callback: Optional[Callable[[bytes], None]] = None
+        self.rtcm_callback: Optional[Callable[[memoryview], None]] = None
         self.nmea_callback: Optional[Callable[[str], None]] = None
 
-        # GPS status tracking
-        self.gps_status = {
-            'satellites': 0,
-            'fix_quality': 0,
-            'fix_type': 'No Fix',
-            'hdop': 0.0,
-            'last_update': None,
-            'current_lat': 0.0,
-            'current_lon': 0.0,
-            'current_alt': 0.0
-        }
+        # Partial RTCM frame / NMEA sentence carried between serial reads,
+        # staged in fixed-size buffers; the *_len counters mark the fill level
+        self._rtcm_buffer = bytearray(_RTCM_MAX_FRAME)
+        self._rtcm_len = 0
+        self._nmea_buffer = bytearray(_NMEA_MAX_SENTENCE)
+        self._nmea_len = 0
+
+        # GPS status tracking: an immutable snapshot in _STATUS_FIELDS order,
+        # replaced wholesale by the reader thread so readers never see a
+        # half-updated fix
+        self._status = (0, 0, 'No Fix', 0.0, None, 0.0, 0.0, 0.0)
 
         # Store configured base position for accuracy calculation
         self.base_position = {'lat': 0.0, 'lon': 0.0, 'alt': 0.0}
+        # Base latitude/longitude in radians and cos(latitude), computed once
+        # so each accuracy update only evaluates trig for the current fix
+        self._base_trig = (0.0, 0.0, 1.0)
 
     def connect(self) -> bool:
         """
@@ -57,20 +125,74 @@ class LC29HSerial:
             True if connection successful, False otherwise
         """
         try:
-            self.serial_conn = serial.Serial(
-                port=self.port,
-                baudrate=self.baudrate,
-                timeout=self.timeout,
-                bytesize=serial.EIGHTBITS,
-                parity=serial.PARITY_NONE,
-                stopbits=serial.STOPBITS_ONE
-            )
+            self.serial_conn = self._open_serial()
             logger.info(f"Connected to LC29H on {self.port} at {self.baudrate} baud")
             return True
         except serial.SerialException as e:
             logger.error(f"Failed to connect to {self.port}: {e}")
             return False
 
+    def _open_serial(self) -> serial.Serial:
+        """Open and tune the serial port for bulk reads"""
+        conn = serial.Serial(
+            port=self.port,
+            baudrate=self.baudrate,
+            timeout=self.timeout,
+            bytesize=serial.EIGHTBITS,
+            parity=serial.PARITY_NONE,
+            stopbits=serial.STOPBITS_ONE,
+            # Return a read once the line goes quiet after a burst
+            inter_byte_timeout=0.01
+        )
+        # Only some platforms (Windows) let pyserial size the driver buffer
+        if hasattr(conn, 'set_buffer_size'):
+            conn.set_buffer_size(rx_size=16384)
+        self._set_low_latency(conn)
+        return conn
+
+    def _set_low_latency(self, conn: serial.Serial):
+        """
+        Ask the tty driver for low-latency mode (ASYNC_LOW_LATENCY)
+
+        USB-serial adapters such as FTDI otherwise hold received bytes for
+        up to 16 ms before handing them to the kernel. Linux only; failures
+        are ignored since not every driver supports it.
+        """
+        try:
+            import fcntl
+            import termios
+
+            ASYNC_LOW_LATENCY = 0x2000
+            buf = bytearray(128)  # Large enough for struct serial_struct
+            fd = conn.fileno()
+            fcntl.ioctl(fd, termios.TIOCGSERIAL, buf)
+            flags = struct.unpack_from('i', buf, 16)[0]  # type, line, port, irq, flags
+            if not flags & ASYNC_LOW_LATENCY:
+                struct.pack_into('i', buf, 16, flags | ASYNC_LOW_LATENCY)
+                fcntl.ioctl(fd, termios.TIOCSSERIAL, buf)
+                logger.debug("Enabled low-latency mode on serial port")
+        except (ImportError, AttributeError, OSError) as e:
+            logger.debug(f"Low-latency serial mode not available: {e}")
+
+    def _set_realtime_priority(self):
+        """
+        Move the calling thread to the SCHED_FIFO real-time scheduling class
+
+        Under SCHED_OTHER a busy Pi can delay the reader's wakeup after a
+        serial interrupt by a millisecond or more. Opt-in through
+        realtime_priority, and best effort: it needs Linux and root or
+        CAP_SYS_NICE, and failures are ignored so the thread keeps normal
+        priority.
+        """
+        if not self.realtime_priority:
+            return
+        try:
+            # pid 0 is the calling thread on Linux
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(self.realtime_priority))
+            logger.debug("GPS reader thread running with SCHED_FIFO priority")
+        except (AttributeError, OSError) as e:
+            logger.debug(f"Real-time scheduling not available: {e}")
+
     def disconnect(self):
         """Close serial connection"""
         self.stop_reading()
@@ -90,8 +212,6 @@ class LC29HSerial:
         Returns:
             tuple: (x, y, z) in meters
         """
-        import math
-
         # WGS84 ellipsoid constants
         a = 6378137.0  # Semi-major axis (equatorial radius) in meters
         f = 1 / 298.257223563  # Flattening
@@ -100,14 +220,16 @@ class LC29HSerial:
         # Convert to radians
         lat_rad = math.radians(lat)
         lon_rad = math.radians(lon)
+        sin_lat = math.sin(lat_rad)
+        cos_lat = math.cos(lat_rad)
 
         # Calculate radius of curvature in prime vertical
-        N = a / math.sqrt(1 - e2 * math.sin(lat_rad) ** 2)
+        N = a / math.sqrt(1 - e2 * sin_lat * sin_lat)
 
         # Calculate ECEF coordinates
-        x = (N + alt) * math.cos(lat_rad) * math.cos(lon_rad)
-        y = (N + alt) * math.cos(lat_rad) * math.sin(lon_rad)
-        z = ((1 - e2) * N + alt) * math.sin(lat_rad)
+        x = (N + alt) * cos_lat * math.cos(lon_rad)
+        y = (N + alt) * cos_lat * math.sin(lon_rad)
+        z = ((1 - e2) * N + alt) * sin_lat
 
         return x, y, z
 
@@ -125,41 +247,29 @@ class LC29HSerial:
 
         # Store base position for accuracy calculations
         self.base_position = {'lat': lat, 'lon': lon, 'alt': alt}
+        lat_rad = math.radians(lat)
+        self._base_trig = (lat_rad, math.radians(lon), math.cos(lat_rad))
 
         # Convert LLA to ECEF XYZ coordinates for PQTMCFGSVIN command
         x, y, z = self._lla_to_ecef(lat, lon, alt)
         logger.info(f"Base position - LAT:{lat:.8f}, LON:{lon:.8f}, ALT:{alt:.4f}m")
         logger.info(f"ECEF coordinates - X:{x:.4f}, Y:{y:.4f}, Z:{z:.4f}")
 
-        # Step 1: Set receiver to base mode
+        # Step 1: Set receiver to base mode and save it
         # PQTMCFGRCVRMODE,W,2 = Write, Mode 2 (Base Station)
-        cmd_str = "PQTMCFGRCVRMODE,W,2"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Set receiver mode to base station")
-        time.sleep(0.2)
-
-        # Step 2: Save configuration
-        cmd_str = "PQTMSAVEPAR"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Saved base mode configuration")
+        self._send_commands(_CMD_RCVRMODE_BASE, _CMD_SAVEPAR)
+        logger.info("Set receiver mode to base station and saved configuration")
+        # Let the firmware switch modes before the base position is written
         time.sleep(0.5)
 
-        # Step 3: Configure base position with ECEF coordinates
+        # Step 2: Configure base position with ECEF coordinates and save it
         # PQTMCFGSVIN,W,2,0,0,x,y,z
         # W=write, 2=fixed position mode, 0,0=survey-in params (unused for fixed)
-        cmd_str = f"PQTMCFGSVIN,W,2,0,0,{x:.4f},{y:.4f},{z:.4f}"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Configured fixed base position")
-        time.sleep(0.2)
-
-        # Step 4: Save configuration again
-        cmd_str = "PQTMSAVEPAR"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Saved position configuration")
+        self._send_commands(
+            _nmea_command(f"PQTMCFGSVIN,W,2,0,0,{x:.4f},{y:.4f},{z:.4f}"),
+            _CMD_SAVEPAR
+        )
+        logger.info("Configured fixed base position and saved configuration")
         time.sleep(0.2)
 
         logger.info("Base station configuration complete")
@@ -178,49 +288,31 @@ class LC29HSerial:
 
         logger.info("Enabling RTCM3 output...")
 
-        # Enable RTCM3 MSM4 messages (MSM7 doesn't save properly per LC29H docs)
-        # PAIR432,1 enables MSM4 messages
-        cmd_str = "PAIR432,1"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Enabled RTCM3 MSM4 messages")
-        time.sleep(0.1)
-
-        # PAIR434,1 enables antenna position output (1005)
-        cmd_str = "PAIR434,1"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Enabled RTCM3 1005 antenna position messages")
-        time.sleep(0.1)
-
-        # Enable NMEA GGA output for GPS status monitoring
-        # PAIR062,0,01 enables GGA on output
-        cmd_str = "PAIR062,0,01"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Enabled NMEA GGA output")
-        time.sleep(0.1)
-
-        # Save configuration
-        cmd_str = "PQTMSAVEPAR"
-        cmd = f"${cmd_str}*{self._calc_checksum(cmd_str)}\r\n"
-        self._send_command(cmd)
-        logger.info("Saved RTCM configuration")
+        # The LC29H parses back-to-back commands, so send them in one write:
+        # - PAIR432,1 enables RTCM3 MSM4 messages (MSM7 doesn't save properly
+        #   per LC29H docs)
+        # - PAIR434,1 enables antenna position output (1005)
+        # - PAIR062,0,01 enables NMEA GGA output for GPS status monitoring
+        # - PQTMSAVEPAR saves the configuration
+        self._send_commands(_CMD_RTCM_MSM4, _CMD_RTCM_1005, _CMD_NMEA_GGA, _CMD_SAVEPAR)
+        logger.info("Enabled RTCM3 MSM4 and 1005 messages and NMEA GGA output")
+        # Give the firmware time to commit the saved configuration
+        time.sleep(0.2)
 
         logger.info(f"RTCM output configuration complete")
 
-    def _calc_checksum(self, sentence: str) -> str:
-        """Calculate NMEA checksum (XOR of all characters between $ and *)"""
-        checksum = 0
-        for char in sentence:
-            checksum ^= ord(char)
-        return f"{checksum:02X}"
+    def _send_command(self, command: bytes):
+        """Send a framed command to LC29H"""
+        if self.serial_conn and self.serial_conn.is_open:
+            self.serial_conn.write(command)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Sent command: %s", command.strip().decode('ascii'))
 
-    def _send_command(self, command: str):
-        """Send command to LC29H"""
+    def _send_commands(self, *commands: bytes):
+        """Send several framed commands to LC29H in a single write"""
+        self._send_command(b''.join(commands))
         if self.serial_conn and self.serial_conn.is_open:
-            self.serial_conn.write(command.encode('ascii'))
-            logger.debug(f"Sent command: {command.strip()}")
+            self.serial_conn.flush()
 
     def start_reading(self):
         """Start background thread to read data from GPS"""
@@ -243,49 +335,45 @@ class LC29HSerial:
 
     def _read_loop(self):
         """Background thread to continuously read GPS data"""
-        rtcm_buffer = bytearray()
-        nmea_buffer = bytearray()
+        self._set_realtime_priority()
+        self._rtcm_len = 0
+        self._nmea_len = 0
+        poll_ms = int((self.timeout or 1.0) * 1000)
+        poller = None
+        fd = None
 
         while self.running and self.serial_conn and self.serial_conn.is_open:
             try:
-                if self.serial_conn.in_waiting > 0:
-                    data = self.serial_conn.read(self.serial_conn.in_waiting)
-
-                    # Process data - could be NMEA or RTCM3
-                    for byte in data:
-                        # RTCM3 messages start with 0xD3
-                        if byte == 0xD3:
-                            if rtcm_buffer:
-                                self._process_rtcm(bytes(rtcm_buffer))
-                            rtcm_buffer = bytearray([byte])
-                        elif rtcm_buffer:
-                            rtcm_buffer.append(byte)
-                            # RTCM message complete check
-                            if len(rtcm_buffer) >= 3:
-                                msg_len = ((rtcm_buffer[1] & 0x03) << 8) | rtcm_buffer[2]
-                                # 3 header + msg_len + 3 CRC24
-                                if len(rtcm_buffer) >= msg_len + 6:
-                                    self._process_rtcm(bytes(rtcm_buffer[:msg_len + 6]))
-                                    rtcm_buffer = bytearray()
-                        else:
-                            # NMEA sentence detection (starts with $, ends with \n)
-                            if byte == ord(b'$'):
-                                nmea_buffer = bytearray([byte])
-                            elif nmea_buffer:
-                                nmea_buffer.append(byte)
-                                if byte == ord(b'\n'):
-                                    # Complete NMEA sentence
-                                    try:
-                                        sentence = nmea_buffer.decode('ascii', errors='ignore').strip()
-                                        self._process_nmea(sentence)
-                                    except:
-                                        pass
-                                    nmea_buffer = bytearray()
-
-                time.sleep(0.01)  # Small delay to prevent CPU spinning
+                if poller is None and hasattr(select, 'poll'):
+                    # POSIX: wait on the raw fd and read it directly, skipping
+                    # pyserial's per-read bookkeeping
+                    fd = self.serial_conn.fileno()
+                    poller = select.poll()
+                    poller.register(fd, select.POLLIN)
+
+                if poller is not None:
+                    if not poller.poll(poll_ms):
+                        continue
+                    try:
+                        data = os.read(fd, _READ_SIZE)
+                    except (BlockingIOError, InterruptedError):
+                        # Spurious wakeup or signal on the non-blocking fd;
+                        # nothing is wrong with the port
+                        continue
+                    if not data:
+                        raise serial.SerialException(
+                            "device reports readiness to read but returned no data")
+                else:
+                    # Blocks for the first byte (up to the read timeout), then
+                    # keeps reading until the burst ends
+                    data = self.serial_conn.read(_READ_SIZE)
+                    if not data:
+                        continue
+                self._process_data(data)
 
             except (serial.SerialException, OSError) as e:
                 logger.warning(f"Serial I/O error: {e} - attempting to reconnect")
+                poller = None  # Re-register the new fd after reconnecting
                 time.sleep(1.0)
                 # Try to reconnect
                 try:
@@ -295,17 +383,10 @@ class LC29HSerial:
                         except:
                             pass
                     time.sleep(0.5)
-                    self.serial_conn = serial.Serial(
-                        port=self.port,
-                        baudrate=self.baudrate,
-                        timeout=self.timeout,
-                        bytesize=serial.EIGHTBITS,
-                        parity=serial.PARITY_NONE,
-                        stopbits=serial.STOPBITS_ONE
-                    )
+                    self.serial_conn = self._open_serial()
                     logger.info("Successfully reconnected to GPS")
-                    rtcm_buffer = bytearray()  # Clear buffers after reconnect
-                    nmea_buffer = bytearray()
+                    self._rtcm_len = 0  # Clear buffers after reconnect
+                    self._nmea_len = 0
                 except Exception as reconnect_error:
                     logger.error(f"Failed to reconnect: {reconnect_error}")
                     time.sleep(2.0)
@@ -313,65 +394,187 @@ class LC29HSerial:
                 logger.error(f"Unexpected error in read loop: {e}")
                 time.sleep(0.5)
 
-    def _process_rtcm(self, rtcm_data: bytes):
-        """Process received RTCM3 message"""
-        if len(rtcm_data) < 6:
-            return
+    def _process_data(self, data: bytes):
+        """
+        Split a chunk of serial data into RTCM3 frames and NMEA sentences
+
+        Delimiters are located with bytes.find and frame bodies are copied
+        as whole slices, so no Python code runs per byte. A partial frame
+        or sentence at the end of the chunk is kept for the next call.
+
+        Args:
+            data: Bytes read from the serial port
+        """
+        rtcm_buffer = self._rtcm_buffer
+        rtcm_len = self._rtcm_len
+        nmea_buffer = self._nmea_buffer
+        nmea_len = self._nmea_len
+        pos = 0
+        end = len(data)
+
+        while pos < end:
+            if rtcm_len:
+                # Collect the 3-byte header first to learn the frame length
+                if rtcm_len < 3:
+                    take = min(3 - rtcm_len, end - pos)
+                    rtcm_buffer[rtcm_len:rtcm_len + take] = data[pos:pos + take]
+                    rtcm_len += take
+                    pos += take
+                    if rtcm_len < 3:
+                        break
+                    if rtcm_buffer[1] & 0xFC:
+                        # Reserved bits set: not a real preamble, rescan after it
+                        data = bytes(rtcm_buffer[1:3]) + data[pos:]
+                        pos = 0
+                        end = len(data)
+                        rtcm_len = 0
+                        continue
+
+                # 3 header + msg_len + 3 CRC24
+                total = (_RTCM_HEADER.unpack_from(rtcm_buffer)[0] & 0x3FF) + 6
+                take = min(total - rtcm_len, end - pos)
+                rtcm_buffer[rtcm_len:rtcm_len + take] = data[pos:pos + take]
+                rtcm_len += take
+                pos += take
+                if rtcm_len < total:
+                    break  # Rest of the frame arrives in a later read
+                if not self._process_rtcm(memoryview(rtcm_buffer)[:total]):
+                    # False preamble: rescan the bytes after it, which may
+                    # hold the start of a real frame or sentence
+                    data = bytes(rtcm_buffer[1:total]) + data[pos:]
+                    pos = 0
+                    end = len(data)
+                rtcm_len = 0
+
+            elif nmea_len:
+                # NMEA sentence runs to the next newline
+                newline = data.find(b'\n', pos)
+                limit = end if newline == -1 else newline
+                # A new sentence or RTCM frame before the newline cuts this one off
+                i_rtcm = data.find(b'\xd3', pos, limit)
+                i_nmea = data.find(b'$', pos, limit)
+                if i_rtcm != -1 or i_nmea != -1:
+                    nmea_len = 0
+                    pos = max(i_rtcm, i_nmea) if -1 in (i_rtcm, i_nmea) else min(i_rtcm, i_nmea)
+                    continue
+                stop = end if newline == -1 else newline + 1
+                take = stop - pos
+                if nmea_len + take > _NMEA_MAX_SENTENCE:
+                    # Too long to be a sentence we use; drop it
+                    nmea_len = 0
+                    pos = stop
+                    continue
+                nmea_buffer[nmea_len:nmea_len + take] = data[pos:stop]
+                nmea_len += take
+                pos = stop
+                if newline == -1:
+                    break
+                # Complete NMEA sentence; without a user callback only GGA
+                # is of interest, so skip decoding everything else
+                if nmea_buffer[3:6] == b'GGA' or self.nmea_callback:
+                    try:
+                        sentence = nmea_buffer[:nmea_len].decode('ascii', errors='ignore').strip()
+                        self._process_nmea(sentence)
+                    except:
+                        pass
+                nmea_len = 0
+
+            else:
+                # Skip ahead to whichever of an RTCM3 preamble (0xD3) or an
+                # NMEA start ($) comes first
+                i_rtcm = data.find(b'\xd3', pos)
+                i_nmea = data.find(b'$', pos)
+                if i_rtcm == -1 and i_nmea == -1:
+                    break
+                if i_nmea == -1 or (i_rtcm != -1 and i_rtcm < i_nmea):
+                    # Fast path: a whole frame inside this chunk is dispatched as
+                    # a view of the read, without staging it in rtcm_buffer
+                    if i_rtcm + 3 <= end:
+                        header = _RTCM_HEADER.unpack_from(data, i_rtcm)[0]
+                        if not header & 0xFC00:
+                            frame_end = i_rtcm + (header & 0x3FF) + 6
+                            if frame_end <= end:
+                                if self._process_rtcm(memoryview(data)[i_rtcm:frame_end]):
+                                    pos = frame_end
+                                else:
+                                    pos = i_rtcm + 1  # False preamble, rescan after it
+                                continue
+                    rtcm_buffer[0] = 0xD3
+                    rtcm_len = 1
+                    pos = i_rtcm + 1
+                else:
+                    nmea_buffer[0] = 0x24
+                    nmea_len = 1
+                    pos = i_nmea + 1
+
+        self._rtcm_len = rtcm_len
+        self._nmea_len = nmea_len
+
+    def _process_rtcm(self, rtcm_data: memoryview) -> bool:
+        """
+        Process received RTCM3 message (a view into the read buffers)
+
+        Returns:
+            False if the frame failed validation
+        """
+        if len(rtcm_data) < 6 or rtcm_data[0] != 0xD3:
+            return False
 
         # Verify RTCM3 frame
-        if rtcm_data[0] == 0xD3:
-            msg_type = (rtcm_data[3] << 4) | (rtcm_data[4] >> 4)
-            logger.debug(f"Received RTCM3 message type {msg_type}, length {len(rtcm_data)}")
+        msg_type = _RTCM_TYPE.unpack_from(rtcm_data)[0] >> 4
 
-            if self.rtcm_callback:
-                self.rtcm_callback(rtcm_data)
+        # Drop frames whose CRC24Q does not match (line noise or a false
+        # preamble); a matching CRC leaves a zero remainder over the frame
+        if _calc_crc24q(rtcm_data):
+            logger.debug("Discarding RTCM3 message type %d with bad CRC24Q", msg_type)
+            return False
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Received RTCM3 message type %d, length %d", msg_type, len(rtcm_data))
+
+        if self.rtcm_callback:
+            self.rtcm_callback(rtcm_data)
+        return True
 
     def _process_nmea(self, sentence: str):
         """Process NMEA sentence and extract GPS status"""
         if not sentence.startswith('$'):
             return
 
+        # Only GGA feeds the status; anything else matters just to a callback
+        is_gga = sentence[3:6] == 'GGA'
+        if not is_gga and self.nmea_callback is None:
+            return
+
         try:
             # Parse GGA sentence for fix quality and satellite count
-            if 'GGA' in sentence:
-                parts = sentence.split(',')
-                if len(parts) > 9:
+            if is_gga:
+                m = _GGA_RE.match(sentence)
+                if m:
                     # Fix quality: 0=no fix, 1=GPS, 2=DGPS, 4=RTK fixed, 5=RTK float
-                    fix = parts[6]
-                    sats = parts[7]
-                    hdop = parts[8]
-                    alt = parts[9]
-
-                    # Parse position data
-                    lat_str = parts[2]
-                    lat_dir = parts[3]
-                    lon_str = parts[4]
-                    lon_dir = parts[5]
-
-                    fix_types = {
-                        '0': 'No Fix',
-                        '1': 'GPS Fix',
-                        '2': 'DGPS Fix',
-                        '4': 'RTK Fixed',
-                        '5': 'RTK Float',
-                        '6': 'Dead Reckoning'
-                    }
+                    lat_str, lat_dir, lon_str, lon_dir, fix, sats, hdop, alt = m.groups()
 
                     try:
-                        self.gps_status['fix_quality'] = int(fix) if fix else 0
-                        self.gps_status['fix_type'] = fix_types.get(fix, f'Unknown ({fix})')
-                        self.gps_status['satellites'] = int(sats) if sats else 0
-                        self.gps_status['hdop'] = float(hdop) if hdop else 0.0
-
-                        # Convert NMEA position format to decimal degrees
+                        # Convert NMEA position format to decimal degrees,
+                        # keeping the last position when the fix has none
                         if lat_str and lon_str:
                             lat = self._nmea_to_decimal(lat_str, lat_dir)
                             lon = self._nmea_to_decimal(lon_str, lon_dir)
-                            self.gps_status['current_lat'] = lat
-                            self.gps_status['current_lon'] = lon
-                            self.gps_status['current_alt'] = float(alt) if alt else 0.0
-
-                        self.gps_status['last_update'] = time.time()
+                            alt = float(alt) if alt else 0.0
+                        else:
+                            lat, lon, alt = self._status[5:]
+
+                        fix_quality = int(fix) if fix else 0
+                        fix_type = _FIX_TYPES[fix_quality] if 0 <= fix_quality < len(_FIX_TYPES) else None
+
+                        self._status = (
+                            int(sats) if sats else 0,
+                            fix_quality,
+                            fix_type or f'Unknown ({fix})',
+                            float(hdop) if hdop else 0.0,
+                            time.time(),
+                            lat, lon, alt
+                        )
                     except ValueError:
                         pass
 
@@ -380,7 +583,7 @@ class LC29HSerial:
                 self.nmea_callback(sentence)
 
         except Exception as e:
-            logger.debug(f"Error parsing NMEA: {e}")
+            logger.debug("Error parsing NMEA: %s", e)
 
     def _nmea_to_decimal(self, coord_str: str, direction: str) -> float:
         """
@@ -396,27 +599,19 @@ class LC29HSerial:
         if not coord_str:
             return 0.0
 
-        # For latitude: DDMM.MMMMM, for longitude: DDDMM.MMMMM
-        if direction in ['N', 'S']:
-            # Latitude: first 2 digits are degrees
-            degrees = float(coord_str[:2])
-            minutes = float(coord_str[2:])
-        else:
-            # Longitude: first 3 digits are degrees
-            degrees = float(coord_str[:3])
-            minutes = float(coord_str[3:])
-
+        # DDMM.MMMMM / DDDMM.MMMMM: degrees are everything above the hundreds
+        degrees, minutes = divmod(float(coord_str), 100.0)
         decimal = degrees + (minutes / 60.0)
 
         # Apply direction
-        if direction in ['S', 'W']:
+        if direction in ('S', 'W'):
             decimal = -decimal
 
         return decimal
 
     def get_gps_status(self) -> dict:
         """Get current GPS status with position accuracy"""
-        status = self.gps_status.copy()
+        status = dict(zip(_STATUS_FIELDS, self._status))
         # Check if data is stale (no update in 5 seconds)
         if status['last_update']:
             if time.time() - status['last_update'] > 5:
@@ -432,7 +627,7 @@ class LC29HSerial:
             not status['stale']):
             accuracy = self._calculate_position_error(
                 status['current_lat'], status['current_lon'], status['current_alt'],
-                self.base_position['lat'], self.base_position['lon'], self.base_position['alt']
+                self.base_position['alt']
             )
             status['position_accuracy'] = accuracy
         else:
@@ -441,29 +636,28 @@ class LC29HSerial:
         return status
 
     def _calculate_position_error(self, current_lat: float, current_lon: float, current_alt: float,
-                                    base_lat: float, base_lon: float, base_alt: float) -> dict:
+                                    base_alt: float) -> dict:
         """
         Calculate position error between current GPS position and fixed base position
 
         Args:
             current_lat, current_lon, current_alt: Current GPS position
-            base_lat, base_lon, base_alt: Configured base station position
+            base_alt: Configured base station altitude (the base latitude and
+                longitude come from the trig cached by configure_base_mode)
 
         Returns:
             dict with horizontal, vertical, and 3D position errors in meters
         """
-        import math
-
         # Calculate horizontal distance using Haversine formula
         R = 6371000  # Earth radius in meters
 
+        base_lat_rad, base_lon_rad, base_cos_lat = self._base_trig
         lat1 = math.radians(current_lat)
-        lat2 = math.radians(base_lat)
-        dlat = math.radians(base_lat - current_lat)
-        dlon = math.radians(base_lon - current_lon)
+        dlat = base_lat_rad - lat1
+        dlon = base_lon_rad - math.radians(current_lon)
 
         a = (math.sin(dlat / 2) ** 2 +
-             math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2)
+             math.cos(lat1) * base_cos_lat * math.sin(dlon / 2) ** 2)
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         horizontal_error = R * c
 
@@ -479,8 +673,14 @@ class LC29HSerial:
             'error_3d_m': round(error_3d, 3)
         }
 
-    def set_rtcm_callback(self, callback: Callable[[bytes], None]):
-        """Set callback function to handle RTCM messages"""
+    def set_rtcm_callback(self, callback: Callable[[memoryview], None]):
+        """
+        Set callback function to handle RTCM messages
+
+        The callback receives each frame as a memoryview that is only valid
+        for the duration of the call; callbacks that keep the frame must copy
+        it (e.g. bytes(frame)).
+        """
         self.rtcm_callback = callback
 
     def set_nmea_callback(self, callback: Callable[[str], None]):
@@ -5,15 +5,27 @@ Broadcasts RTCM3 corrections from LC29H GPS module to NTRIP clients
 """
 
 import socket
+import selectors
 import threading
 import logging
 import base64
+import hashlib
 import time
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Set
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+# Unsent data a client may fall behind by before it is dropped (~1 minute
+# of corrections at typical base-station rates)
+MAX_CLIENT_BACKLOG = 256 * 1024
+
+# Seconds a new connection has to send its request headers, and the most
+# header data read before a request without a blank line is rejected
+REQUEST_TIMEOUT = 10.0
+MAX_REQUEST_SIZE = 4096
+
 
 class NTRIPClient:
     """Represents a connected NTRIP client"""
@@ -25,16 +37,46 @@ class NTRIPClient:
         self.username = ""
         self.connected_at = datetime.now()
         self.bytes_sent = 0
+        # Data the socket could not take yet; flushed by the server loop
+        self.outbuf = bytearray()
 
     def send_data(self, data: bytes) -> bool:
-        """Send data to client, return False if failed"""
+        """
+        Send data to client without blocking, return False if failed
+
+        Whatever the socket cannot take immediately is queued in outbuf
+        (behind anything already queued, to keep the stream in order).
+        """
         try:
-            self.conn.sendall(data)
-            self.bytes_sent += len(data)
+            if self.outbuf:
+                self.outbuf += data
+            else:
+                sent = self.conn.send(data)
+                if sent < len(data):
+                    self.outbuf += data[sent:]
+        except BlockingIOError:
+            self.outbuf += data
+        except OSError as e:
+            logger.warning(f"Failed to send to {self.addr}: {e}")
+            return False
+
+        if len(self.outbuf) > MAX_CLIENT_BACKLOG:
+            logger.warning(f"Client {self.addr} is too slow, {len(self.outbuf)} bytes queued")
+            return False
+        self.bytes_sent += len(data)
+        return True
+
+    def flush(self) -> bool:
+        """Send as much queued data as the socket accepts, return False if failed"""
+        try:
+            sent = self.conn.send(self.outbuf)
+        except BlockingIOError:
             return True
-        except (socket.error, BrokenPipeError) as e:
+        except OSError as e:
             logger.warning(f"Failed to send to {self.addr}: {e}")
             return False
+        del self.outbuf[:sent]
+        return True
 
     def close(self):
         """Close client connection"""
@@ -44,8 +86,37 @@ class NTRIPClient:
             pass
 
 
+@lru_cache(maxsize=None)
+def _http_response(code: int, message: str, extra_headers: str = "") -> bytes:
+    """Encoded HTTP response head; the server only sends a handful of these"""
+    response = f"HTTP/1.1 {code} {message}\r\n"
+    response += "Server: LC29H-NTRIP-Server/1.0\r\n"
+    response += extra_headers
+    response += "\r\n"
+    return response.encode('utf-8')
+
+
+class _PendingRequest:
+    """A new connection whose request headers are still arriving"""
+
+    __slots__ = ('conn', 'addr', 'data', 'deadline')
+
+    def __init__(self, conn: socket.socket, addr: tuple):
+        self.conn = conn
+        self.addr = addr
+        self.data = b''
+        self.deadline = time.monotonic() + REQUEST_TIMEOUT
+
+
 class NTRIPServer:
-    """NTRIP Caster server for broadcasting RTK corrections"""
+    """
+    NTRIP Caster server for broadcasting RTK corrections
+
+    A single thread runs a selectors loop that accepts connections, reads
+    request headers and flushes clients whose sockets were full. Broadcasts
+    write to the non-blocking client sockets directly and leave any
+    remainder for the loop.
+    """
 
     def __init__(self, host: str = '0.0.0.0', port: int = 2101):
         """
@@ -60,11 +131,24 @@ class NTRIPServer:
         self.server_socket: Optional[socket.socket] = None
         self.running = False
         self.accept_thread: Optional[threading.Thread] = None
+        self.selector: Optional[selectors.BaseSelector] = None
         self.clients: List[NTRIPClient] = []
         self.clients_lock = threading.Lock()
+        self._pending: List[_PendingRequest] = []
+        # Clients that queued data since the loop last looked, and clients
+        # other threads dropped that the loop still has to close (both
+        # guarded by clients_lock), plus a socket pair to wake the loop
+        self._backlogged: List[NTRIPClient] = []
+        self._dropped: List[NTRIPClient] = []
+        self._wake_r: Optional[socket.socket] = None
+        self._wake_w: Optional[socket.socket] = None
         self.mountpoints: Dict[str, dict] = {}
         self.require_auth = False
-        self.credentials: Dict[str, str] = {}  # username: password
+        # username: SHA-256 of the user's "Basic" token, base64("user:pass");
+        # the token set is what incoming headers are checked against
+        self.credentials: Dict[str, bytes] = {}
+        self._auth_tokens: Set[bytes] = set()
+        self._sourcetable: Optional[bytes] = None  # Encoded on first request
 
     def add_mountpoint(self, name: str, identifier: str = "", format: str = "RTCM 3.3",
                        format_details: str = "1005(10),1074(1),1084(1),1094(1),1124(1),1230(10)",
@@ -104,6 +188,7 @@ class NTRIPServer:
             'fee': 'N',
             'bitrate': '9600'
         }
+        self._sourcetable = None
         logger.info(f"Added mountpoint: {name}")
 
     def set_authentication(self, username: str, password: str):
@@ -115,7 +200,10 @@ class NTRIPServer:
             password: Password for authentication
         """
         self.require_auth = True
-        self.credentials[username] = password
+        token = base64.b64encode(f"{username}:{password}".encode('utf-8'))
+        self.credentials[username] = hashlib.sha256(token).digest()
+        self._auth_tokens = set(self.credentials.values())
+        self._sourcetable = None
         logger.info(f"Authentication enabled for user: {username}")
 
     def start(self) -> bool:
@@ -130,10 +218,18 @@ class NTRIPServer:
             self.server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             self.server_socket.bind((self.host, self.port))
             self.server_socket.listen(5)
+            self.server_socket.setblocking(False)
+
+            self.selector = selectors.DefaultSelector()
+            self.selector.register(self.server_socket, selectors.EVENT_READ, None)
+            self._wake_r, self._wake_w = socket.socketpair()
+            self._wake_r.setblocking(False)
+            self._wake_w.setblocking(False)
+            self.selector.register(self._wake_r, selectors.EVENT_READ, self._wake_r)
             self.running = True
 
-            # Start accept thread
-            self.accept_thread = threading.Thread(target=self._accept_clients, daemon=True)
+            # Start the connection loop thread
+            self.accept_thread = threading.Thread(target=self._serve, daemon=True)
             self.accept_thread.start()
 
             logger.info(f"NTRIP server started on {self.host}:{self.port}")
@@ -146,62 +242,187 @@ class NTRIPServer:
     def stop(self):
         """Stop NTRIP server and disconnect all clients"""
         self.running = False
+        self._wake()
+
+        if self.accept_thread:
+            self.accept_thread.join(timeout=2.0)
 
         # Close all client connections
         with self.clients_lock:
-            for client in self.clients:
+            for client in self.clients + self._dropped:
                 client.close()
             self.clients.clear()
+            self._dropped.clear()
+        for pending in self._pending:
+            pending.conn.close()
+        self._pending.clear()
 
         # Close server socket
         if self.server_socket:
             self.server_socket.close()
-
-        if self.accept_thread:
-            self.accept_thread.join(timeout=2.0)
+        if self.selector:
+            self.selector.close()
+        for sock in (self._wake_r, self._wake_w):
+            if sock:
+                sock.close()
 
         logger.info("NTRIP server stopped")
 
-    def _accept_clients(self):
-        """Accept incoming client connections"""
+    def _wake(self):
+        """Wake the connection loop from another thread"""
+        try:
+            self._wake_w.send(b'\0')
+        except (AttributeError, BlockingIOError, OSError):
+            pass  # Not started, or a wake-up is already pending
+
+    def _serve(self):
+        """Connection loop: accept, read requests, flush backlogged clients"""
         while self.running:
             try:
-                self.server_socket.settimeout(1.0)
-                conn, addr = self.server_socket.accept()
-                logger.info(f"New connection from {addr}")
-
-                # Handle client in separate thread
-                client_thread = threading.Thread(
-                    target=self._handle_client,
-                    args=(conn, addr),
-                    daemon=True
-                )
-                client_thread.start()
-
-            except socket.timeout:
-                continue
-            except Exception as e:
+                events = self.selector.select(timeout=1.0)
+            except OSError as e:
                 if self.running:
-                    logger.error(f"Error accepting connection: {e}")
-
-    def _handle_client(self, conn: socket.socket, addr: tuple):
-        """Handle individual client connection"""
+                    logger.error(f"Error waiting for connections: {e}")
+                break
+
+            # One bad socket must not end the loop: it is the only thread
+            # accepting clients and flushing their backlogs
+            for key, mask in events:
+                try:
+                    if key.data is None:
+                        self._accept_client()
+                    elif key.data is self._wake_r:
+                        try:
+                            while self._wake_r.recv(512):
+                                pass
+                        except BlockingIOError:
+                            pass
+                    elif isinstance(key.data, _PendingRequest):
+                        self._read_request(key.data)
+                    else:
+                        self._service_client(key.data, mask)
+                except Exception:
+                    logger.exception(f"Error handling connection event for {key.fileobj}")
+
+            for housekeeping in (self._close_dropped, self._watch_backlogged, self._expire_pending):
+                try:
+                    housekeeping()
+                except Exception:
+                    logger.exception(f"Error in connection loop {housekeeping.__name__}")
+
+    def _accept_client(self):
+        """Accept an incoming connection and wait for its request"""
+        try:
+            conn, addr = self.server_socket.accept()
+        except (BlockingIOError, OSError) as e:
+            if self.running and not isinstance(e, BlockingIOError):
+                logger.error(f"Error accepting connection: {e}")
+            return
+        logger.info(f"New connection from {addr}")
+        conn.setblocking(False)
+        pending = _PendingRequest(conn, addr)
+        self._pending.append(pending)
+        self.selector.register(conn, selectors.EVENT_READ, pending)
+
+    def _read_request(self, pending: _PendingRequest):
+        """Collect request headers; handle the request once they are complete"""
         try:
-            # Receive HTTP request
-            conn.settimeout(10.0)
-            request = conn.recv(4096).decode('utf-8', errors='ignore')
+            chunk = pending.conn.recv(MAX_REQUEST_SIZE)
+        except BlockingIOError:
+            return
+        except OSError:
+            chunk = b''
+        pending.data += chunk
+        complete = b'\r\n\r\n' in pending.data
+        if chunk and not complete and len(pending.data) < MAX_REQUEST_SIZE:
+            return  # Headers still arriving
+
+        self.selector.unregister(pending.conn)
+        self._pending.remove(pending)
+        if chunk and not complete:
+            logger.warning(f"Request from {pending.addr} exceeds {MAX_REQUEST_SIZE} bytes")
+            self._send_response(pending.conn, 400, "Bad Request")
+            pending.conn.close()
+            return
+        self._handle_client(pending.conn, pending.addr, pending.data)
+
+    def _expire_pending(self):
+        """Reject connections that did not send a complete request in time"""
+        now = time.monotonic()
+        for pending in [p for p in self._pending if p.deadline < now]:
+            logger.warning(f"Request from {pending.addr} timed out")
+            self.selector.unregister(pending.conn)
+            self._pending.remove(pending)
+            self._send_response(pending.conn, 400, "Bad Request")
+            pending.conn.close()
+
+    def _close_dropped(self):
+        """Unregister and close clients that other threads dropped"""
+        with self.clients_lock:
+            dropped, self._dropped = self._dropped, []
+        for client in dropped:
+            try:
+                self.selector.unregister(client.conn)
+            except (KeyError, ValueError):
+                pass
+            client.close()
 
-            if not request:
-                conn.close()
+    def _watch_backlogged(self):
+        """Watch clients with queued data for writability"""
+        with self.clients_lock:
+            backlogged, self._backlogged = self._backlogged, []
+        for client in backlogged:
+            try:
+                self.selector.modify(client.conn, selectors.EVENT_READ | selectors.EVENT_WRITE, client)
+            except (KeyError, ValueError, OSError):
+                pass  # Disconnected in the meantime
+
+    def _service_client(self, client: NTRIPClient, mask: int):
+        """Handle readiness events on a connected client socket"""
+        with self.clients_lock:
+            if client not in self.clients:
                 return
+            ok = True
+            if mask & selectors.EVENT_READ:
+                # Clients may upload NMEA positions; they are not used, but
+                # an empty read means the client hung up
+                try:
+                    ok = bool(client.conn.recv(4096))
+                except BlockingIOError:
+                    pass
+                except OSError:
+                    ok = False
+            if ok and mask & selectors.EVENT_WRITE:
+                ok = client.flush()
+                if ok and not client.outbuf:
+                    self.selector.modify(client.conn, selectors.EVENT_READ, client)
+            if not ok:
+                self._remove_client(client)
+
+    def _remove_client(self, client: NTRIPClient):
+        """Disconnect a client; caller holds clients_lock and is the loop thread"""
+        logger.info(f"Client {client.addr} disconnected from {client.mountpoint}")
+        self.clients.remove(client)
+        try:
+            self.selector.unregister(client.conn)
+        except (KeyError, ValueError):
+            pass
+        client.close()
 
-            lines = request.split('\r\n')
-            if not lines:
+    def _handle_client(self, conn: socket.socket, addr: tuple, raw_request: bytes):
+        """Handle a client's NTRIP request"""
+        try:
+            # Work on the raw header block; only the request line and the
+            # Authorization value are ever decoded
+            head = raw_request.partition(b'\r\n\r\n')[0]
+            if not head:
                 conn.close()
                 return
 
+            lines = head.split(b'\r\n')
+
             # Parse request line
-            request_line = lines[0].split()
+            request_line = lines[0].decode('ascii', errors='ignore').split()
             if len(request_line) < 3:
                 self._send_response(conn, 400, "Bad Request")
                 conn.close()
@@ -229,9 +450,10 @@ class NTRIPServer:
                 # Check authentication if required
                 if self.require_auth:
                     auth_header = None
-                    for line in lines:
-                        if line.startswith("Authorization:"):
-                            auth_header = line.split(":", 1)[1].strip()
+                    for line in lines[1:]:
+                        # Header names are case-insensitive
+                        if line[:14].lower() == b'authorization:':
+                            auth_header = line[14:].strip().decode('ascii', errors='ignore')
                             break
 
                     if not auth_header or not self._verify_auth(auth_header):
@@ -241,13 +463,20 @@ class NTRIPServer:
                         return
 
                 # Accept client
-                self._send_response(conn, 200, "OK",
-                                  extra_headers="Content-Type: gnss/data\r\n")
+                if not self._send_response(conn, 200, "OK",
+                                           extra_headers="Content-Type: gnss/data\r\n"):
+                    conn.close()
+                    return
 
                 # Add client to list
+                # Frames are already coalesced per broadcast, so send each
+                # batch right away instead of letting Nagle hold it back
+                # behind an unacknowledged one
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
                 client = NTRIPClient(conn, addr, mountpoint)
                 with self.clients_lock:
                     self.clients.append(client)
+                    self.selector.register(conn, selectors.EVENT_READ, client)
 
                 logger.info(f"Client {addr} connected to mountpoint {mountpoint}")
                 logger.info(f"Active clients: {len(self.clients)}")
@@ -265,6 +494,16 @@ class NTRIPServer:
 
     def _send_sourcetable(self, conn: socket.socket):
         """Send NTRIP sourcetable to client"""
+        if self._sourcetable is None:
+            self._sourcetable = self._build_sourcetable()
+
+        if self._send_reply(conn, self._sourcetable):
+            logger.debug("Sent sourcetable")
+        else:
+            logger.warning("Failed to send sourcetable")
+
+    def _build_sourcetable(self) -> bytes:
+        """Encode the NTRIP sourcetable for the current mountpoints"""
         sourcetable = "SOURCETABLE 200 OK\r\n"
         sourcetable += "Server: LC29H-NTRIP-Server/1.0\r\n"
         sourcetable += "Content-Type: text/plain\r\n"
@@ -283,41 +522,36 @@ class NTRIPServer:
             sourcetable += str_line
 
         sourcetable += "ENDSOURCETABLE\r\n"
+        return sourcetable.encode('utf-8')
 
-        try:
-            conn.sendall(sourcetable.encode('utf-8'))
-            logger.debug("Sent sourcetable")
-        except Exception as e:
-            logger.error(f"Failed to send sourcetable: {e}")
+    def _send_response(self, conn: socket.socket, code: int, message: str, extra_headers: str = "") -> bool:
+        """Send HTTP response to client, return False if it could not be sent"""
+        return self._send_reply(conn, _http_response(code, message, extra_headers))
 
-    def _send_response(self, conn: socket.socket, code: int, message: str, extra_headers: str = ""):
-        """Send HTTP response to client"""
-        response = f"HTTP/1.1 {code} {message}\r\n"
-        response += "Server: LC29H-NTRIP-Server/1.0\r\n"
-        response += extra_headers
-        response += "\r\n"
+    @staticmethod
+    def _send_reply(conn: socket.socket, data: bytes) -> bool:
+        """
+        Send a reply on a non-blocking socket, return False if it did not fit
 
+        Replies go out on the loop thread, which must never block on one
+        client. A fresh connection's send buffer easily holds any reply, so
+        a client that cannot take one whole is not worth waiting for.
+        """
         try:
-            conn.sendall(response.encode('utf-8'))
-        except:
-            pass
+            return conn.send(data) == len(data)
+        except OSError:
+            return False
 
     def _verify_auth(self, auth_header: str) -> bool:
         """Verify Basic authentication credentials"""
-        try:
-            if not auth_header.startswith("Basic "):
-                return False
-
-            encoded = auth_header[6:]
-            decoded = base64.b64decode(encoded).decode('utf-8')
-            username, password = decoded.split(":", 1)
-
-            return username in self.credentials and self.credentials[username] == password
-
-        except Exception as e:
-            logger.warning(f"Authentication verification failed: {e}")
+        if not auth_header.startswith("Basic "):
             return False
 
+        # Match the token as sent against the precomputed ones, without
+        # decoding it; only digests are kept, so no plaintext is compared
+        token = auth_header[6:].strip().encode('ascii', errors='ignore')
+        return hashlib.sha256(token).digest() in self._auth_tokens
+
     def broadcast_rtcm(self, rtcm_data: bytes, mountpoint: str = None):
         """
         Broadcast RTCM data to all connected clients
@@ -330,6 +564,7 @@ class NTRIPServer:
             return
 
         disconnected_clients = []
+        wake = False
 
         with self.clients_lock:
             for client in self.clients:
@@ -337,28 +572,51 @@ class NTRIPServer:
                 if mountpoint and client.mountpoint != mountpoint:
                     continue
 
-                # Send data to client
+                # Send data to client; a full socket queues the rest
+                had_backlog = bool(client.outbuf)
                 if not client.send_data(rtcm_data):
                     disconnected_clients.append(client)
+                elif client.outbuf and not had_backlog:
+                    self._backlogged.append(client)
+                    wake = True
 
-            # Remove disconnected clients
+            # Stop broadcasting to disconnected clients; the selector is not
+            # thread-safe, so the loop unregisters and closes them
             for client in disconnected_clients:
                 logger.info(f"Client {client.addr} disconnected from {client.mountpoint}")
                 self.clients.remove(client)
-                client.close()
+                self._dropped.append(client)
+                wake = True
+
+        if wake:
+            self._wake()
 
     def get_stats(self) -> dict:
         """Get server statistics"""
         with self.clients_lock:
             return {
                 'active_clients': len(self.clients),
-                'clients': [
-                    {
-                        'address': f"{c.addr[0]}:{c.addr[1]}",
-                        'mountpoint': c.mountpoint,
-                        'connected_at': c.connected_at.isoformat(),
-                        'bytes_sent': c.bytes_sent
-                    }
-                    for c in self.clients
-                ]
+                'clients': [self._client_info(c) for c in self.clients]
             }
+
+    def iter_clients(self):
+        """
+        Yield a status dict per connected client
+
+        The client list is copied under the lock and the dicts are built
+        afterwards, so a slow consumer never holds up broadcasts.
+        """
+        with self.clients_lock:
+            clients = list(self.clients)
+        for client in clients:
+            yield self._client_info(client)
+
+    @staticmethod
+    def _client_info(client: NTRIPClient) -> dict:
+        """Status dict for one client"""
+        return {
+            'address': f"{client.addr[0]}:{client.addr[1]}",
+            'mountpoint': client.mountpoint,
+            'connected_at': client.connected_at.isoformat(),
+            'bytes_sent': client.bytes_sent
+        }
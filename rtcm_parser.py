@@ -5,11 +5,43 @@ Utilities for parsing and validating RTCM3 messages from LC29H
 """
 
 import struct
+import sys
 import logging
+from array import array
 
 logger = logging.getLogger(__name__)
 
 
+def _build_crc24q_table() -> tuple:
+    """Precompute the CRC24Q remainder for every possible leading byte"""
+    table = []
+    for i in range(256):
+        crc = i << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= 0x1864CFB
+        table.append(crc & 0xFFFFFF)
+    return tuple(table)
+
+
+_CRC24Q_TABLE = _build_crc24q_table()
+
+# Slice-by-2: remainder for every leading 16-bit word, derived from the byte
+# table, so the CRC loop consumes two bytes per iteration
+_CRC24Q_TABLE16 = tuple([((crc << 8) & 0xFFFFFF) ^ _CRC24Q_TABLE[(crc >> 16) ^ lo]
+                         for crc in _CRC24Q_TABLE for lo in range(256)])
+
+_LITTLE_ENDIAN = sys.byteorder == 'little'
+
+# Consumed bytes RTCMMessageBuffer lets accumulate before compacting
+_COMPACT_THRESHOLD = 4096
+
+# 38-bit signed ECEF fields in message 1005
+_MASK38 = (1 << 38) - 1
+_SIGN38 = 1 << 37
+
+
 class RTCM3Parser:
     """Parse and validate RTCM3 messages"""
 
@@ -82,14 +114,15 @@ class RTCM3Parser:
         if len(data) != expected_len:
             # Only log if this looks like a real RTCM message (not random noise)
             if msg_type > 0:
-                logger.debug(f"RTCM message length mismatch: expected {expected_len}, got {len(data)}, type {msg_type}")
+                logger.debug("RTCM message length mismatch: expected %d, got %d, type %d",
+                             expected_len, len(data), msg_type)
             return False, msg_type, msg_len
 
         # Validate CRC24Q
         if not RTCM3Parser._verify_crc24q(data):
             # Only log known message types (likely corruption of real data)
             if msg_type in RTCM3Parser.MESSAGE_TYPES:
-                logger.debug(f"RTCM message type {msg_type} failed CRC24 check")
+                logger.debug("RTCM message type %d failed CRC24 check", msg_type)
             return False, msg_type, msg_len
 
         return True, msg_type, msg_len
@@ -108,13 +141,9 @@ class RTCM3Parser:
         if len(data) < 6:
             return False
 
-        # CRC is last 3 bytes
-        msg_crc = (data[-3] << 16) | (data[-2] << 8) | data[-1]
-
-        # Calculate CRC for all bytes except the CRC itself
-        calc_crc = RTCM3Parser._calc_crc24q(data[:-3])
-
-        return msg_crc == calc_crc
+        # Running the CRC over the message and its appended CRC leaves a zero
+        # remainder when they match, so no slice or CRC unpacking is needed
+        return RTCM3Parser._calc_crc24q(data) == 0
 
     @staticmethod
     def _calc_crc24q(data: bytes) -> int:
@@ -127,14 +156,22 @@ class RTCM3Parser:
         Returns:
             24-bit CRC value
         """
+        # Walk the data as big-endian 16-bit words, one table lookup per word
+        even = len(data) & ~1
+        words = array('H')
+        words.frombytes(data[:even])
+        if _LITTLE_ENDIAN:
+            words.byteswap()
+
         crc = 0
-        for byte in data:
-            crc ^= (byte << 16)
-            for _ in range(8):
-                crc <<= 1
-                if crc & 0x1000000:
-                    crc ^= 0x1864CFB
-        return crc & 0xFFFFFF
+        table16 = _CRC24Q_TABLE16
+        for word in words:
+            crc = ((crc << 16) & 0xFFFFFF) ^ table16[(crc >> 8) ^ word]
+
+        # Odd trailing byte
+        if even != len(data):
+            crc = ((crc << 8) & 0xFFFFFF) ^ _CRC24Q_TABLE[(crc >> 16) ^ data[-1]]
+        return crc
 
     @staticmethod
     def parse_message_1005(data: bytes) -> dict:
@@ -150,36 +187,35 @@ class RTCM3Parser:
         if len(data) < 19:
             return {}
 
-        # Skip message type (12 bits) and extract fields
+        # The 152-bit payload as one big-endian integer; a field ending at
+        # bit n (counted from the start) is right-aligned by shifting 152 - n
         # Reference: RTCM 10403.3 standard
-        bits = ''.join(f'{b:08b}' for b in data)
+        bits = int.from_bytes(data[:19], 'big')
 
-        # Station ID (12 bits)
-        station_id = int(bits[12:24], 2)
+        # Station ID (bits 12-23, after the 12-bit message type)
+        station_id = (bits >> 128) & 0xFFF
 
-        # ITRF realization year (6 bits)
-        itrf = int(bits[24:30], 2)
+        # ITRF realization year (bits 24-29)
+        itrf = (bits >> 122) & 0x3F
 
-        # GPS indicator, GLONASS, Galileo, Reserved (4 bits total)
-        # Skip to ECEF coordinates
+        # GPS, GLONASS, Galileo and reference-station indicators (bits 30-33)
 
-        # ECEF X (38 bits, signed, 0.0001 m)
-        ecef_x_raw = int(bits[34:72], 2)
-        if ecef_x_raw & (1 << 37):  # Check sign bit
-            ecef_x_raw -= (1 << 38)
-        ecef_x = ecef_x_raw * 0.0001
+        # ECEF X (bits 34-71, 38 bits signed, 0.0001 m)
+        # Sign-extend with (raw ^ sign) - sign
+        ecef_x = (((bits >> 80) & _MASK38) ^ _SIGN38) - _SIGN38
+        ecef_x *= 0.0001
 
-        # ECEF Y (38 bits, signed, 0.0001 m)
-        ecef_y_raw = int(bits[72:110], 2)
-        if ecef_y_raw & (1 << 37):
-            ecef_y_raw -= (1 << 38)
-        ecef_y = ecef_y_raw * 0.0001
+        # Single receiver oscillator and reserved bits (72-73)
 
-        # ECEF Z (38 bits, signed, 0.0001 m)
-        ecef_z_raw = int(bits[110:148], 2)
-        if ecef_z_raw & (1 << 37):
-            ecef_z_raw -= (1 << 38)
-        ecef_z = ecef_z_raw * 0.0001
+        # ECEF Y (bits 74-111, 38 bits signed, 0.0001 m)
+        ecef_y = (((bits >> 40) & _MASK38) ^ _SIGN38) - _SIGN38
+        ecef_y *= 0.0001
+
+        # Quarter cycle indicator (bits 112-113)
+
+        # ECEF Z (bits 114-151, 38 bits signed, 0.0001 m)
+        ecef_z = ((bits & _MASK38) ^ _SIGN38) - _SIGN38
+        ecef_z *= 0.0001
 
         return {
             'message_type': 1005,
@@ -201,6 +237,7 @@ class RTCMMessageBuffer:
 
     def __init__(self):
         self.buffer = bytearray()
+        self._pos = 0  # Start of unconsumed data in buffer
         self.messages = []
 
     def add_data(self, data: bytes):
@@ -215,44 +252,59 @@ class RTCMMessageBuffer:
 
     def _extract_messages(self):
         """Extract complete RTCM messages from buffer"""
-        while len(self.buffer) >= 6:
+        buffer = self.buffer
+        pos = self._pos
+        end = len(buffer)
+
+        while end - pos >= 6:
             # Look for RTCM3 preamble (0xD3)
-            preamble_idx = self.buffer.find(0xD3)
+            preamble_idx = buffer.find(0xD3, pos)
 
             if preamble_idx == -1:
-                # No preamble found, clear buffer
-                self.buffer.clear()
-                return
+                # No preamble found, discard everything
+                pos = end
+                break
 
-            if preamble_idx > 0:
-                # Remove data before preamble
-                self.buffer = self.buffer[preamble_idx:]
+            # Skip data before preamble
+            pos = preamble_idx
 
             # Check if we have enough bytes for header
-            if len(self.buffer) < 3:
-                return
+            if end - pos < 3:
+                break
 
             # Extract message length
-            msg_len = ((self.buffer[1] & 0x03) << 8) | self.buffer[2]
+            msg_len = ((buffer[pos + 1] & 0x03) << 8) | buffer[pos + 2]
             total_len = msg_len + 6  # 3 header + msg_len + 3 CRC
 
             # Check if complete message is available
-            if len(self.buffer) < total_len:
-                return  # Wait for more data
+            if end - pos < total_len:
+                break  # Wait for more data
 
-            # Extract complete message
-            msg_data = bytes(self.buffer[:total_len])
-            self.buffer = self.buffer[total_len:]
+            # Validate the frame in place and copy out only valid ones
+            frame = memoryview(buffer)[pos:pos + total_len]
+            is_valid, msg_type, _ = RTCM3Parser.validate_message(frame)
+            msg_data = bytes(frame) if is_valid else None
+            frame.release()
 
-            # Validate and store message
-            is_valid, msg_type, _ = RTCM3Parser.validate_message(msg_data)
+            # Store valid message
             if is_valid:
+                pos += total_len
                 self.messages.append(msg_data)
-                logger.debug(f"Extracted RTCM message type {msg_type}, length {len(msg_data)}")
+                logger.debug("Extracted RTCM message type %d, length %d", msg_type, len(msg_data))
             else:
+                # Likely a 0xD3 inside other data; resume the search right
+                # after it so a real frame it overlapped is not lost
+                pos += 1
                 # Only log if it's a recognized message type (not noise)
                 if msg_type > 0 and msg_type in RTCM3Parser.MESSAGE_TYPES:
-                    logger.debug(f"Invalid RTCM message discarded, type {msg_type}")
+                    logger.debug("Invalid RTCM message discarded, type %d", msg_type)
+
+        # Drop consumed bytes only once they add up, instead of re-slicing
+        # the buffer after every frame
+        if pos == end or pos >= _COMPACT_THRESHOLD:
+            del buffer[:pos]
+            pos = 0
+        self._pos = pos
 
     def get_messages(self) -> list[bytes]:
         """
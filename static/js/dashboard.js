@@ -114,13 +114,21 @@ function updateStats(stats) {
     // Client info
     document.getElementById('clientCount').textContent = stats.active_clients;
 
-    // Update client list
+    // Update status indicator
+    updateStatusIndicator(stats.status);
+
+    // Update last update time
+    document.getElementById('lastUpdate').textContent = new Date().toLocaleTimeString();
+}
+
+// Update connected client list
+function updateClients(clients) {
     const clientList = document.getElementById('clientList');
-    if (stats.active_clients === 0) {
+    if (clients.length === 0) {
         clientList.innerHTML = '<p class="no-clients">No clients connected</p>';
     } else {
         let html = '';
-        stats.clients.forEach(client => {
+        clients.forEach(client => {
             const connectedTime = formatDateTime(client.connected_at);
             const duration = calculateDuration(client.connected_at);
             html += `
@@ -136,12 +144,6 @@ function updateStats(stats) {
         });
         clientList.innerHTML = html;
     }
-
-    // Update status indicator
-    updateStatusIndicator(stats.status);
-
-    // Update last update time
-    document.getElementById('lastUpdate').textContent = new Date().toLocaleTimeString();
 }
 
 // Calculate connection duration
@@ -242,12 +244,21 @@ async function fetchStatus() {
         if (!response.ok) throw new Error('Failed to fetch status');
         const stats = await response.json();
         updateStats(stats);
+        updateClients(stats.active_clients > 0 ? await fetchClients() : []);
     } catch (error) {
         console.error('Error fetching status:', error);
         updateStatusIndicator('error');
     }
 }
 
+// Fetch connected clients (newline-delimited JSON, one client per line)
+async function fetchClients() {
+    const response = await fetch('/api/clients');
+    if (!response.ok) throw new Error('Failed to fetch clients');
+    const text = await response.text();
+    return text.split('\n').filter(line => line).map(line => JSON.parse(line));
+}
+
 // Fetch configuration (once on load)
 async function fetchConfig() {
     try {
@@ -5,13 +5,67 @@ from the LC29H base station
 """
 
 import socket
+import struct
 import sys
 import time
 import argparse
-from datetime import datetime
+from collections import Counter
 import base64
 
 
+def _build_crc24q_table() -> tuple:
+    """CRC24Q remainder for every possible leading byte"""
+    table = []
+    for i in range(256):
+        crc = i << 16
+        for _ in range(8):
+            crc <<= 1
+            if crc & 0x1000000:
+                crc ^= 0x1864CFB
+        table.append(crc & 0xFFFFFF)
+    return tuple(table)
+
+
+# Kept local (rather than imported from rtcm_parser) so this script runs on
+# its own on any machine
+_CRC24Q_TABLE = _build_crc24q_table()
+
+
+def _calc_crc24q(data) -> int:
+    """CRC24Q of data; a frame including its own CRC leaves a zero remainder"""
+    crc = 0
+    table = _CRC24Q_TABLE
+    for byte in data:
+        crc = ((crc << 8) & 0xFFFFFF) ^ table[(crc >> 16) ^ byte]
+    return crc
+
+# RTCM3 header after the preamble: reserved bits + 10-bit length, then the
+# payload's first 16 bits holding the 12-bit message type
+_RTCM_HEADER = struct.Struct('>xHH')
+
+# Socket receive buffer requested for the NTRIP connection
+_RECV_BUFFER_SIZE = 256 * 1024
+
+# Human-readable descriptions of the RTCM message types a base sends
+_RTCM_MSG_DESCRIPTIONS = {
+    1005: "Station Coordinates",
+    1006: "Station Coordinates + Height",
+    1074: "GPS MSM4",
+    1075: "GPS MSM5",
+    1077: "GPS MSM7",
+    1084: "GLONASS MSM4",
+    1085: "GLONASS MSM5",
+    1087: "GLONASS MSM7",
+    1094: "Galileo MSM4",
+    1095: "Galileo MSM5",
+    1097: "Galileo MSM7",
+    1124: "BeiDou MSM4",
+    1125: "BeiDou MSM5",
+    1127: "BeiDou MSM7",
+    1230: "GLONASS Code-Phase Biases"
+}
+
+
 class NTRIPClient:
     """Simple NTRIP client for testing base station connections"""
 
@@ -29,13 +83,23 @@ class NTRIPClient:
         self.bytes_received = 0
         self.messages_received = 0
         self.start_time = None
-        self.message_types = {}
+        self.message_types = Counter()
+
+        # Receive buffer reused for every recv_into()
+        self._recv_buffer = bytearray(4096)
+        self._recv_view = memoryview(self._recv_buffer)
 
     def connect(self) -> bool:
         """Connect to NTRIP caster"""
         try:
             print(f"Connecting to {self.host}:{self.port}...")
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Room for bursts of correction data; set before connecting so
+            # the advertised TCP window can use it
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER_SIZE)
+            # Send the request (and anything sent upstream later) without
+            # waiting on Nagle
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.socket.settimeout(10)
             self.socket.connect((self.host, self.port))
 
@@ -79,41 +143,54 @@ class NTRIPClient:
             print(f"✗ Connection error: {e}")
             return False
 
-    def parse_rtcm3(self, data: bytes) -> list:
+    def parse_rtcm3(self, data: bytes) -> tuple:
         """
         Parse RTCM3 messages from byte stream
-        Returns list of (message_type, message_data) tuples
+        Returns (messages, consumed) where messages is a list of
+        (message_type, offset, length) tuples locating each frame in data
+        and consumed is the number of leading bytes that can be dropped
+        (complete frames and noise)
         """
         messages = []
         i = 0
 
-        while i < len(data):
-            # Look for RTCM3 preamble (0xD3)
-            if data[i] != 0xD3:
-                i += 1
-                continue
+        end = len(data)
+
+        with memoryview(data) as view:
+            while i < end:
+                # Look for RTCM3 preamble (0xD3)
+                j = data.find(0xD3, i)
+                if j < 0:
+                    i = end  # Nothing but noise left
+                    break
+                i = j
 
-            # Need at least 6 bytes for header + CRC
-            if i + 6 > len(data):
-                break
+                # Need at least 6 bytes for header + CRC
+                if i + 6 > end:
+                    break
 
-            # Parse message length
-            msg_len = ((data[i + 1] & 0x03) << 8) | data[i + 2]
-            total_len = msg_len + 6  # header (3) + message + CRC (3)
+                # Parse message length and type in one read
+                length_word, type_word = _RTCM_HEADER.unpack_from(data, i)
+                msg_len = length_word & 0x3FF
+                total_len = msg_len + 6  # header (3) + message + CRC (3)
 
-            # Check if we have the complete message
-            if i + total_len > len(data):
-                break
+                # Check if we have the complete message
+                if i + total_len > end:
+                    break
 
-            # Extract message type (first 12 bits of message payload)
-            if msg_len >= 2:
-                msg_type = (data[i + 3] << 4) | ((data[i + 4] >> 4) & 0x0F)
-                msg_data = data[i:i + total_len]
-                messages.append((msg_type, msg_data))
+                # A CRC24Q mismatch means a corrupt frame or a 0xD3 inside
+                # other data; resume the search right after it
+                if _calc_crc24q(view[i:i + total_len]):
+                    i += 1
+                    continue
 
-            i += total_len
+                # Message type is the first 12 bits of the payload
+                if msg_len >= 2:
+                    messages.append((type_word >> 4, i, total_len))
 
-        return messages
+                i += total_len
+
+        return messages, i
 
     def receive_loop(self, duration: int = None, max_messages: int = None):
         """
@@ -133,9 +210,8 @@ class NTRIPClient:
         print("=" * 60 + "\n")
 
         try:
-            self.socket.settimeout(5.0)
             buffer = bytearray()
-            last_stats_time = time.time()
+            next_stats = time.monotonic() + 2.0
 
             while True:
                 # Check duration limit
@@ -149,42 +225,34 @@ class NTRIPClient:
                     break
 
                 try:
-                    # Receive data
-                    data = self.socket.recv(4096)
-                    if not data:
+                    # Receive data, waiting no longer than the next
+                    # statistics tick so they print on a steady cadence
+                    self.socket.settimeout(max(next_stats - time.monotonic(), 0.01))
+                    n = self.socket.recv_into(self._recv_view)
+                    if not n:
                         print("\n✗ Connection closed by server")
                         break
 
-                    self.bytes_received += len(data)
-                    buffer.extend(data)
-
-                    # Parse RTCM messages
-                    messages = self.parse_rtcm3(bytes(buffer))
-
-                    for msg_type, msg_data in messages:
-                        self.messages_received += 1
-
-                        # Track message types
-                        if msg_type not in self.message_types:
-                            self.message_types[msg_type] = 0
-                        self.message_types[msg_type] += 1
+                    self.bytes_received += n
+                    buffer += self._recv_view[:n]
 
-                        # Remove processed message from buffer
-                        idx = buffer.find(msg_data)
-                        if idx >= 0:
-                            del buffer[:idx + len(msg_data)]
+                    # Parse RTCM messages, then drop everything parsed in
+                    # one go; only a partial frame is carried over
+                    messages, consumed = self.parse_rtcm3(buffer)
+                    del buffer[:consumed]
 
-                    # Print statistics every 2 seconds
-                    if time.time() - last_stats_time >= 2.0:
-                        self._print_stats()
-                        last_stats_time = time.time()
+                    # Track message types
+                    self.messages_received += len(messages)
+                    self.message_types.update(msg_type for msg_type, _, _ in messages)
 
                 except socket.timeout:
-                    # Print stats on timeout too
-                    if time.time() - last_stats_time >= 2.0:
-                        self._print_stats()
-                        last_stats_time = time.time()
-                    continue
+                    pass
+
+                # Print statistics every 2 seconds
+                now = time.monotonic()
+                if now >= next_stats:
+                    self._print_stats()
+                    next_stats = now + 2.0
 
         except KeyboardInterrupt:
             print("\n\nStopped by user")
@@ -193,15 +261,18 @@ class NTRIPClient:
 
     def _print_stats(self):
         """Print real-time statistics"""
-        elapsed = time.time() - self.start_time
+        now = time.time()
+        elapsed = now - self.start_time
         rate = self.messages_received / elapsed if elapsed > 0 else 0
         byte_rate = self.bytes_received / elapsed if elapsed > 0 else 0
 
-        print(f"\r[{datetime.now().strftime('%H:%M:%S')}] "
-              f"Messages: {self.messages_received:4d} | "
-              f"Rate: {rate:5.1f} msg/s | "
-              f"Data: {self.bytes_received:6d} bytes ({byte_rate:.0f} B/s)",
-              end='', flush=True)
+        # One write of the finished line; stays on the text layer so it
+        # keeps its order relative to print() output
+        sys.stdout.write(f"\r[{time.strftime('%H:%M:%S', time.localtime(now))}] "
+                         f"Messages: {self.messages_received:4d} | "
+                         f"Rate: {rate:5.1f} msg/s | "
+                         f"Data: {self.bytes_received:6d} bytes ({byte_rate:.0f} B/s)")
+        sys.stdout.flush()
 
     def _print_final_stats(self):
         """Print final statistics"""
@@ -228,24 +299,7 @@ class NTRIPClient:
 
     def _get_message_description(self, msg_type: int) -> str:
         """Get human-readable description of RTCM message type"""
-        descriptions = {
-            1005: "Station Coordinates",
-            1006: "Station Coordinates + Height",
-            1074: "GPS MSM4",
-            1075: "GPS MSM5",
-            1077: "GPS MSM7",
-            1084: "GLONASS MSM4",
-            1085: "GLONASS MSM5",
-            1087: "GLONASS MSM7",
-            1094: "Galileo MSM4",
-            1095: "Galileo MSM5",
-            1097: "Galileo MSM7",
-            1124: "BeiDou MSM4",
-            1125: "BeiDou MSM5",
-            1127: "BeiDou MSM7",
-            1230: "GLONASS Code-Phase Biases"
-        }
-        return descriptions.get(msg_type, "Unknown")
+        return _RTCM_MSG_DESCRIPTIONS.get(msg_type, "Unknown")
 
     def disconnect(self):
         """Close connection"""
@@ -15,10 +15,74 @@ import sys
 import time
 import argparse
 import threading
-from datetime import datetime
 import base64
 from typing import Optional
 import math
+import re
+from collections import Counter, deque
+
+# GGA fields: lat, N/S, lon, E/W, fix quality, satellites, HDOP, altitude
+_GGA_RE = re.compile(
+    rb'\$..GGA,[^,]*,([^,]*),([NS]?),([^,]*),([EW]?),([^,]*),([^,]*),([^,]*),([^,]*),'
+)
+
+# Position statistics window, and the samples kept for it (30 s at up to 20 Hz)
+_STATS_WINDOW = 30.0
+_MAX_POSITION_SAMPLES = 600
+
+# Corrections are coalesced into one serial write once this many bytes are
+# pending or the oldest pending byte is this old (seconds)
+_SERIAL_FLUSH_BYTES = 1024
+_SERIAL_FLUSH_DELAY = 0.05
+
+# Socket receive buffer requested for the NTRIP connection
+_RECV_BUFFER_SIZE = 256 * 1024
+
+# GGA fix quality indicator descriptions
+_FIX_TYPES = {
+    0: 'No Fix',
+    1: 'GPS Fix',
+    2: 'DGPS Fix',
+    4: 'RTK Fixed',
+    5: 'RTK Float',
+    6: 'Dead Reckoning'
+}
+
+
+class _RunningStats:
+    """Mean and variance over a sliding window (Welford, with removal)"""
+
+    __slots__ = ('n', 'mean', 'm2')
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, x: float):
+        """Add a value entering the window"""
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self.m2 += delta * (x - self.mean)
+
+    def remove(self, x: float):
+        """Remove a value leaving the window"""
+        self.n -= 1
+        if self.n == 0:
+            # Restart from exact zeros so rounding error cannot accumulate
+            self.mean = 0.0
+            self.m2 = 0.0
+            return
+        delta = x - self.mean
+        self.mean -= delta / self.n
+        self.m2 -= delta * (x - self.mean)
+
+    def std_dev(self) -> float:
+        """Population standard deviation of the window"""
+        if self.n < 2:
+            return 0.0
+        return math.sqrt(max(self.m2, 0.0) / self.n)
 
 
 class PositionMonitor:
@@ -45,10 +109,23 @@ class PositionMonitor:
 
         # Known reference position (for testing accuracy)
         self.reference_position = None
+        # Reference latitude/longitude in radians and cos(latitude), computed
+        # once so each accuracy check only evaluates trig for the current fix
+        self._reference_trig = (0.0, 0.0, 1.0)
 
         # Statistics
-        self.position_samples = []
-        self.fix_quality_history = []
+        # (time, lat, lon, alt, fix_quality) tuples in the window, oldest first
+        self.position_samples = deque(maxlen=_MAX_POSITION_SAMPLES)
+        self.fix_quality_history = deque(maxlen=1000)
+
+        # Running window statistics, updated as samples enter and leave
+        # position_samples; the lock keeps the reader thread and
+        # get_statistics from sliding the window at the same time
+        self._lat_stats = _RunningStats()
+        self._lon_stats = _RunningStats()
+        self._alt_stats = _RunningStats()
+        self._fix_counts = Counter()
+        self._stats_lock = threading.Lock()
 
     def connect(self) -> bool:
         """Connect to GPS receiver"""
@@ -68,6 +145,8 @@ class PositionMonitor:
     def set_reference_position(self, lat: float, lon: float, alt: float):
         """Set known reference position for accuracy calculations"""
         self.reference_position = {'lat': lat, 'lon': lon, 'alt': alt}
+        lat_rad = math.radians(lat)
+        self._reference_trig = (lat_rad, math.radians(lon), math.cos(lat_rad))
         print(f"Reference position set: {lat:.8f}°, {lon:.8f}°, {alt:.2f}m")
 
     def start_monitoring(self):
@@ -87,99 +166,108 @@ class PositionMonitor:
 
     def _read_loop(self):
         """Background thread to read NMEA sentences"""
-        buffer = ""
+        buffer = bytearray()
 
         while self.running:
             try:
-                if self.serial and self.serial.in_waiting > 0:
-                    data = self.serial.read(self.serial.in_waiting).decode('ascii', errors='ignore')
+                # Blocks in the kernel until data arrives (up to the 1 s port
+                # timeout), then drains what is buffered
+                data = self.serial.read(self.serial.in_waiting or 1)
+                if data:
                     buffer += data
 
-                    # Process complete NMEA sentences
-                    while '\n' in buffer:
-                        line, buffer = buffer.split('\n', 1)
-                        line = line.strip()
-                        if line.startswith('$'):
+                    # Process complete NMEA sentences, framed on the raw
+                    # bytes and trimmed once per read
+                    start = 0
+                    idx = buffer.find(b'\n')
+                    while idx >= 0:
+                        line = buffer[start:idx].strip()
+                        if line[:1] == b'$':
                             self._process_nmea(line)
-
-                time.sleep(0.01)
+                        start = idx + 1
+                        idx = buffer.find(b'\n', start)
+                    del buffer[:start]
 
             except Exception as e:
                 print(f"Error reading GPS: {e}")
                 time.sleep(0.5)
 
-    def _process_nmea(self, sentence: str):
-        """Process NMEA sentence"""
+    def _process_nmea(self, sentence: bytes):
+        """Process NMEA sentence (raw ASCII bytes)"""
         try:
-            if 'GGA' in sentence:
-                parts = sentence.split(',')
-                if len(parts) > 9:
-                    # Parse GGA sentence
-                    lat_str = parts[2]
-                    lat_dir = parts[3]
-                    lon_str = parts[4]
-                    lon_dir = parts[5]
-                    fix = parts[6]
-                    sats = parts[7]
-                    hdop = parts[8]
-                    alt = parts[9]
-
-                    fix_types = {
-                        '0': 'No Fix',
-                        '1': 'GPS Fix',
-                        '2': 'DGPS Fix',
-                        '4': 'RTK Fixed',
-                        '5': 'RTK Float',
-                        '6': 'Dead Reckoning'
-                    }
+            # Sentence type sits at a fixed offset after the talker ID
+            if sentence[3:6] == b'GGA':
+                m = _GGA_RE.match(sentence)
+                if m:
+                    lat_str, lat_dir, lon_str, lon_dir, fix, sats, hdop, alt = m.groups()
 
                     if lat_str and lon_str:
                         lat = self._nmea_to_decimal(lat_str, lat_dir)
                         lon = self._nmea_to_decimal(lon_str, lon_dir)
+                        alt = float(alt) if alt else 0.0
+                        fix_quality = int(fix) if fix else 0
+                        now = time.time()
 
                         self.current_position.update({
                             'lat': lat,
                             'lon': lon,
-                            'alt': float(alt) if alt else 0.0,
-                            'fix_quality': int(fix) if fix else 0,
-                            'fix_type': fix_types.get(fix, 'Unknown'),
+                            'alt': alt,
+                            'fix_quality': fix_quality,
+                            'fix_type': _FIX_TYPES.get(fix_quality, 'Unknown'),
                             'satellites': int(sats) if sats else 0,
                             'hdop': float(hdop) if hdop else 0.0,
-                            'last_update': time.time()
+                            'last_update': now
                         })
 
                         # Store sample for statistics
-                        self.position_samples.append({
-                            'time': time.time(),
-                            'lat': lat,
-                            'lon': lon,
-                            'alt': float(alt) if alt else 0.0,
-                            'fix_quality': int(fix) if fix else 0
-                        })
+                        self._add_sample((now, lat, lon, alt, fix_quality))
 
                         # Track fix quality over time
-                        self.fix_quality_history.append(int(fix) if fix else 0)
-                        if len(self.fix_quality_history) > 1000:
-                            self.fix_quality_history.pop(0)
+                        self.fix_quality_history.append(fix_quality)
 
         except Exception as e:
             pass
 
-    def _nmea_to_decimal(self, coord_str: str, direction: str) -> float:
+    def _add_sample(self, sample: tuple):
+        """Add a position sample to the statistics window"""
+        with self._stats_lock:
+            self._expire_samples(sample[0])
+            if len(self.position_samples) == _MAX_POSITION_SAMPLES:
+                self._remove_sample(self.position_samples.popleft())
+
+            self.position_samples.append(sample)
+            _, lat, lon, alt, fix_quality = sample
+            self._lat_stats.add(lat)
+            self._lon_stats.add(lon)
+            self._alt_stats.add(alt)
+            self._fix_counts[fix_quality] += 1
+
+    def _remove_sample(self, sample: tuple):
+        """Take a sample that left the window out of the running statistics"""
+        _, lat, lon, alt, fix_quality = sample
+        self._lat_stats.remove(lat)
+        self._lon_stats.remove(lon)
+        self._alt_stats.remove(alt)
+        self._fix_counts[fix_quality] -= 1
+        if not self._fix_counts[fix_quality]:
+            del self._fix_counts[fix_quality]
+
+    def _expire_samples(self, now: float):
+        """Drop samples older than the statistics window (caller holds the lock)"""
+        samples = self.position_samples
+        while samples and now - samples[0][0] >= _STATS_WINDOW:
+            self._remove_sample(samples.popleft())
+
+    def _nmea_to_decimal(self, coord_str: bytes, direction: bytes) -> float:
         """Convert NMEA coordinate to decimal degrees"""
         if not coord_str:
             return 0.0
 
-        if direction in ['N', 'S']:
-            degrees = float(coord_str[:2])
-            minutes = float(coord_str[2:])
-        else:
-            degrees = float(coord_str[:3])
-            minutes = float(coord_str[3:])
-
+        # DDMM.MMMMM / DDDMM.MMMMM: degrees are everything above the hundreds
+        degrees, minutes = divmod(float(coord_str), 100.0)
         decimal = degrees + (minutes / 60.0)
 
-        if direction in ['S', 'W']:
+        if direction in (b'S', b'W'):
             decimal = -decimal
 
         return decimal
@@ -200,8 +288,6 @@ class PositionMonitor:
         lon1 = self.current_position['lon']
         alt1 = self.current_position['alt']
 
-        lat2 = self.reference_position['lat']
-        lon2 = self.reference_position['lon']
         alt2 = self.reference_position['alt']
 
         if lat1 == 0.0 or lon1 == 0.0:
@@ -210,13 +296,13 @@ class PositionMonitor:
         # Calculate horizontal distance using Haversine formula
         R = 6371000  # Earth radius in meters
 
+        lat2_rad, lon2_rad, cos_lat2 = self._reference_trig
         lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        dlat = math.radians(lat2 - lat1)
-        dlon = math.radians(lon2 - lon1)
+        dlat = lat2_rad - lat1_rad
+        dlon = lon2_rad - math.radians(lon1)
 
         a = (math.sin(dlat / 2) ** 2 +
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
+             math.cos(lat1_rad) * cos_lat2 * math.sin(dlon / 2) ** 2)
         c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
         horizontal_error = R * c
 
@@ -234,53 +320,34 @@ class PositionMonitor:
 
     def get_statistics(self) -> dict:
         """Get position statistics"""
-        if len(self.position_samples) < 2:
-            return {}
-
-        # Get recent samples (last 30 seconds)
-        recent_samples = [s for s in self.position_samples
-                         if time.time() - s['time'] < 30]
-
-        if not recent_samples:
-            return {}
+        with self._stats_lock:
+            # Slide the window to now; what remains is the last 30 seconds
+            self._expire_samples(time.time())
 
-        # Calculate position scatter (precision)
-        lats = [s['lat'] for s in recent_samples]
-        lons = [s['lon'] for s in recent_samples]
-        alts = [s['alt'] for s in recent_samples]
+            sample_count = len(self.position_samples)
+            if sample_count < 2:
+                return {}
 
-        lat_std = self._std_dev(lats)
-        lon_std = self._std_dev(lons)
-        alt_std = self._std_dev(alts)
+            # Calculate position scatter (precision)
+            lat_std = self._lat_stats.std_dev()
+            lon_std = self._lon_stats.std_dev()
+            alt_std = self._alt_stats.std_dev()
+            mean_lat = self._lat_stats.mean
+            fix_counts = dict(self._fix_counts)
 
         # Approximate horizontal scatter in meters
         lat_std_m = lat_std * 111320  # 1 degree lat ≈ 111.32 km
-        lon_std_m = lon_std * 111320 * math.cos(math.radians(lats[0]))
+        lon_std_m = lon_std * 111320 * math.cos(math.radians(mean_lat))
 
         horizontal_scatter = math.sqrt(lat_std_m ** 2 + lon_std_m ** 2)
 
-        # Fix quality distribution
-        fix_counts = {}
-        for sample in recent_samples:
-            fq = sample['fix_quality']
-            fix_counts[fq] = fix_counts.get(fq, 0) + 1
-
         return {
-            'sample_count': len(recent_samples),
+            'sample_count': sample_count,
             'horizontal_scatter_m': horizontal_scatter,
             'vertical_scatter_m': alt_std,
             'fix_quality_distribution': fix_counts
         }
 
-    def _std_dev(self, values: list) -> float:
-        """Calculate standard deviation"""
-        if len(values) < 2:
-            return 0.0
-
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return math.sqrt(variance)
-
     def disconnect(self):
         """Close GPS connection"""
         self.stop_monitoring()
@@ -308,11 +375,21 @@ class NTRIPClient:
         self.bytes_received = 0
         self.messages_received = 0
 
+        # Receive buffer reused for every recv_into()
+        self._recv_buffer = bytearray(4096)
+        self._recv_view = memoryview(self._recv_buffer)
+
     def connect(self) -> bool:
         """Connect to NTRIP caster"""
         try:
             print(f"\nConnecting to NTRIP caster {self.host}:{self.port}...")
             self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            # Room for bursts of correction data; set before connecting so
+            # the advertised TCP window can use it
+            self.socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, _RECV_BUFFER_SIZE)
+            # Send the request (and anything sent upstream later) without
+            # waiting on Nagle
+            self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
             self.socket.settimeout(10)
             self.socket.connect((self.host, self.port))
 
@@ -349,7 +426,6 @@ class NTRIPClient:
     def receive_corrections(self, position_monitor: Optional[PositionMonitor] = None):
         """Receive and forward corrections to GPS"""
         self.running = True
-        self.socket.settimeout(5.0)
 
         print("\n" + "=" * 70)
         print("RECEIVING RTK CORRECTIONS")
@@ -357,60 +433,85 @@ class NTRIPClient:
         print("Press Ctrl+C to stop\n")
 
         start_time = time.time()
-        last_display = time.time()
+        next_display = time.monotonic() + 2.0
+
+        # Corrections waiting for the next serial write, and when they are due
+        pending = bytearray()
+        flush_at = None
 
         try:
             while self.running:
+                # Wait for data no longer than the next display update or
+                # pending serial write
+                deadline = next_display if flush_at is None else min(next_display, flush_at)
                 try:
-                    data = self.socket.recv(4096)
-                    if not data:
+                    self.socket.settimeout(max(deadline - time.monotonic(), 0.01))
+                    n = self.socket.recv_into(self._recv_view)
+                    if not n:
                         print("\n✗ Connection closed")
                         break
 
-                    self.bytes_received += len(data)
+                    self.bytes_received += n
 
-                    # Forward corrections to GPS if connected
+                    # Queue corrections for the GPS if connected
                     if self.gps_serial and self.gps_serial.is_open:
-                        self.gps_serial.write(data)
-
-                    # Update display every 2 seconds
-                    if time.time() - last_display >= 2.0:
-                        elapsed = time.time() - start_time
-                        self._display_status(elapsed, position_monitor)
-                        last_display = time.time()
+                        pending += self._recv_view[:n]
+                        if flush_at is None:
+                            flush_at = time.monotonic() + _SERIAL_FLUSH_DELAY
 
                 except socket.timeout:
-                    # Update display on timeout
-                    elapsed = time.time() - start_time
-                    self._display_status(elapsed, position_monitor)
-                    last_display = time.time()
+                    pass
+
+                now = time.monotonic()
+
+                # Forward queued corrections in one write
+                if pending and (len(pending) >= _SERIAL_FLUSH_BYTES or now >= flush_at):
+                    self._forward_corrections(pending)
+                    flush_at = None
+
+                # Update display every 2 seconds
+                if now >= next_display:
+                    self._display_status(time.time() - start_time, position_monitor)
+                    next_display = now + 2.0
 
         except KeyboardInterrupt:
             print("\n\nStopped by user")
 
+        if pending:
+            self._forward_corrections(pending)
         self.running = False
 
+    def _forward_corrections(self, pending: bytearray):
+        """Write queued corrections to the GPS and clear the queue"""
+        if self.gps_serial.is_open:
+            self.gps_serial.write(pending)
+        pending.clear()
+
     def _display_status(self, elapsed: float, monitor: Optional[PositionMonitor]):
         """Display real-time status"""
+        now = time.time()
         byte_rate = self.bytes_received / elapsed if elapsed > 0 else 0
 
-        # Build status line
-        status = f"\r[{datetime.now().strftime('%H:%M:%S')}] "
-        status += f"Corrections: {self.bytes_received:6d} bytes ({byte_rate:.0f} B/s)"
+        # Build status line from parts, joined once
+        status = [f"\r[{time.strftime('%H:%M:%S', time.localtime(now))}] "
+                  f"Corrections: {self.bytes_received:6d} bytes ({byte_rate:.0f} B/s)"]
 
         if monitor:
             pos = monitor.current_position
-            if pos['last_update'] and (time.time() - pos['last_update']) < 5:
-                status += f" | Fix: {pos['fix_type']:12s} | Sats: {pos['satellites']:2d} | HDOP: {pos['hdop']:.1f}"
+            if pos['last_update'] and (now - pos['last_update']) < 5:
+                status.append(f" | Fix: {pos['fix_type']:12s} | Sats: {pos['satellites']:2d} | HDOP: {pos['hdop']:.1f}")
 
                 # Show accuracy if reference is set
                 accuracy = monitor.get_position_accuracy()
                 if accuracy:
-                    status += f" | Error: {accuracy['horizontal_m']:.3f}m (H) {accuracy['vertical_m']:.3f}m (V)"
+                    status.append(f" | Error: {accuracy['horizontal_m']:.3f}m (H) {accuracy['vertical_m']:.3f}m (V)")
             else:
-                status += " | GPS: No data"
+                status.append(" | GPS: No data")
 
-        print(status, end='', flush=True)
+        # One write of the finished line; stays on the text layer so it
+        # keeps its order relative to print() output
+        sys.stdout.write(''.join(status))
+        sys.stdout.flush()
 
     def disconnect(self):
         """Close NTRIP connection"""
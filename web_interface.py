@@ -4,19 +4,73 @@ Flask Web Interface for RTK Base Station Status
 Provides real-time monitoring dashboard
 """
 
-from flask import Flask, render_template, jsonify
+from flask import Flask, Response, render_template, request
+import gzip
+import hashlib
+import json
 import logging
 import time
-from datetime import datetime, timedelta
-from threading import Thread
+from datetime import datetime
+from threading import Event, Thread
+
+# Serialize API responses with orjson when it is installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Serve with waitress when it is installed, else Flask's development server
+try:
+    from waitress import serve as waitress_serve
+except ImportError:
+    waitress_serve = None
 
 logger = logging.getLogger(__name__)
 
+# JSON responses at least this large are gzipped for clients that accept it
+_GZIP_MIN_SIZE = 256
+_GZIP_MIMETYPES = frozenset(('application/json', 'application/x-ndjson'))
+
+# /api/status keys never change, so the object framing is encoded once and
+# only the values are serialized per refresh
+_STATUS_KEYS = (
+    'status', 'uptime', 'uptime_formatted', 'start_time', 'rtcm_messages',
+    'bytes_broadcast', 'message_rate', 'byte_rate', 'active_clients',
+    'gps_status', 'timestamp'
+)
+# The refresher stops rebuilding /api/status once nobody has polled it for
+# this many seconds (the dashboard polls every 2 s); the next poll rebuilds
+# it inline and wakes the refresher again
+_STATUS_IDLE_AFTER = 10.0
+
+_STATUS_TEMPLATE = b'{' + b','.join(b'"%s":%%b' % key.encode() for key in _STATUS_KEYS) + b'}'
+
+if orjson is not None:
+    _dumps_value = orjson.dumps
+
+    def _dumps_line(value) -> bytes:
+        """One newline-terminated JSON record"""
+        return orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)
+else:
+    def _dumps_value(value) -> bytes:
+        """Compact JSON encoding of a value"""
+        return json.dumps(value, separators=(',', ':')).encode()
+
+    def _dumps_line(value) -> bytes:
+        """One newline-terminated JSON record"""
+        return json.dumps(value, separators=(',', ':')).encode() + b'\n'
+
 
 class WebInterface:
     """Flask web interface for base station monitoring"""
 
-    def __init__(self, base_station, host='0.0.0.0', port=5000):
+    __slots__ = (
+        'base_station', 'host', 'port', 'status_interval', 'app', 'server_thread',
+        '_status_cache', '_last_poll', '_refresh_thread', '_stop_event', '_config_cache',
+        '_start_iso', '_uptime_text', '_index_html'
+    )
+
+    def __init__(self, base_station, host='0.0.0.0', port=5000, status_interval=0.5):
         """
         Initialize web interface
 
@@ -24,10 +78,33 @@ class WebInterface:
             base_station: RTKBaseStation instance
             host: Interface to bind to
             port: Port number
+            status_interval: Seconds between /api/status refreshes while
+                the endpoint is being polled
         """
         self.base_station = base_station
         self.host = host
         self.port = port
+        self.status_interval = status_interval
+
+        # Monotonic time the serialized /api/status body was started and the
+        # body itself, rebuilt by the refresher thread, and the monotonic
+        # time of the last poll (None before the first)
+        self._status_cache = (0.0, b'')
+        self._last_poll = None
+        self._refresh_thread = None
+        self._stop_event = Event()
+
+        # Serialized /api/config body and its ETag; the config only changes
+        # on reload
+        self._config_cache = None
+
+        # Base station start time and its ISO 8601 form, formatted once
+        self._start_iso = (None, None)
+
+        # Whole seconds of uptime and their H:MM:SS form, which only changes
+        # once a second however often the status refreshes
+        self._uptime_text = (None, None)
+
         self.app = Flask(__name__)
         self.app.logger.setLevel(logging.WARNING)  # Reduce Flask logging
 
@@ -36,74 +113,188 @@ class WebInterface:
         log = flask_logging.getLogger('werkzeug')
         log.setLevel(logging.ERROR)
 
+        # The dashboard page has no per-request data; render it once.
+        # url_for needs a request context to build the static URLs
+        with self.app.test_request_context('/'):
+            self._index_html = render_template('index.html').encode()
+
         self._setup_routes()
+        self.app.after_request(self._compress_response)
         self.server_thread = None
 
     def _setup_routes(self):
         """Setup Flask routes"""
 
-        @self.app.route('/')
         def index():
-            """Render main dashboard"""
-            return render_template('index.html')
+            """Serve main dashboard"""
+            return Response(self._index_html, mimetype='text/html')
 
-        @self.app.route('/api/status')
         def api_status():
             """Get current server status"""
             try:
-                stats = self._get_stats()
-                return jsonify(stats)
+                now = time.monotonic()
+                self._last_poll = now
+                built_at, body = self._status_cache
+                if not body or now - built_at > self.status_interval:
+                    # Not built yet, or the refresher has been idle
+                    body = self._refresh_status()
+                response = Response(body, mimetype='application/json')
+                # Status changes continuously, but not faster than the refresher
+                response.headers['Cache-Control'] = 'public, max-age=1'
+                return response
             except Exception as e:
-                logger.error(f"Error getting stats: {e}")
-                return jsonify({'error': str(e)}), 500
+                logger.error("Error getting stats: %s", e)
+                return self._error_response(e)
+
+        def api_clients():
+            """Stream connected NTRIP clients as newline-delimited JSON"""
+            ntrip = self.base_station.ntrip
+            clients = ntrip.iter_clients() if ntrip else ()
+            return Response(map(_dumps_line, clients), mimetype='application/x-ndjson')
 
-        @self.app.route('/api/config')
         def api_config():
             """Get current configuration"""
             try:
-                config = self._get_config_info()
-                return jsonify(config)
+                if self._config_cache is None:
+                    body = _dumps_value(self._get_config_info())
+                    etag = hashlib.md5(body, usedforsecurity=False).hexdigest()
+                    self._config_cache = (body, etag)
+                body, etag = self._config_cache
+
+                # Let browsers revalidate with If-None-Match and get a 304
+                response = Response(body, mimetype='application/json')
+                response.set_etag(etag)
+                response.headers['Cache-Control'] = 'no-cache'
+                return response.make_conditional(request)
             except Exception as e:
-                logger.error(f"Error getting config: {e}")
-                return jsonify({'error': str(e)}), 500
+                logger.error("Error getting config: %s", e)
+                return self._error_response(e)
 
-    def _get_stats(self):
-        """Get current statistics"""
-        uptime = 0
-        if self.base_station.stats['start_time']:
-            uptime = time.time() - self.base_station.stats['start_time']
+        # GET only, without Flask's automatic OPTIONS handling, so each poll
+        # matches a single method on a static rule
+        for rule, view in (('/', index),
+                           ('/api/status', api_status),
+                           ('/api/clients', api_clients),
+                           ('/api/config', api_config)):
+            self.app.add_url_rule(rule, view.__name__, view, methods=['GET'],
+                                  provide_automatic_options=False)
+
+    @staticmethod
+    def _error_response(error: Exception) -> Response:
+        """JSON 500 response for a failed API call"""
+        return Response(_dumps_value({'error': str(error)}), status=500,
+                        mimetype='application/json')
+
+    @staticmethod
+    def _compress_response(response):
+        """Gzip JSON responses when the client accepts it"""
+        if (response.mimetype not in _GZIP_MIMETYPES or
+                response.status_code != 200 or
+                response.is_streamed or
+                'Content-Encoding' in response.headers or
+                not request.accept_encodings['gzip']):
+            return response
+
+        body = response.get_data()
+        if len(body) < _GZIP_MIN_SIZE:
+            return response
 
-        # Get NTRIP server stats
-        ntrip_stats = {'active_clients': 0, 'clients': []}
-        if self.base_station.ntrip:
-            ntrip_stats = self.base_station.ntrip.get_stats()
+        # Level 1: these are small, repetitive payloads where the fastest
+        # level already gets most of the reduction
+        response.set_data(gzip.compress(body, compresslevel=1))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.vary.add('Accept-Encoding')
 
-        # Calculate rates
+        # The compressed body is a different representation of the same data
+        etag, weak = response.get_etag()
+        if etag and not weak:
+            response.set_etag(etag, weak=True)
+        return response
+
+    def _refresh_status(self) -> bytes:
+        """Rebuild and publish the serialized /api/status body"""
+        # Stamped before building, so the age covers the stats being read
+        built_at = time.monotonic()
+        body = _STATUS_TEMPLATE % tuple(map(_dumps_value, self._get_stats()))
+        self._status_cache = (built_at, body)
+        return body
+
+    def _status_refresher(self):
+        """Keep the /api/status body current so requests only copy bytes"""
+        while not self._stop_event.wait(self.status_interval):
+            last_poll = self._last_poll
+            if last_poll is None or time.monotonic() - last_poll > _STATUS_IDLE_AFTER:
+                continue  # Nobody is polling
+            try:
+                self._refresh_status()
+            except Exception as e:
+                logger.error("Error refreshing stats: %s", e)
+
+    def _get_stats(self) -> tuple:
+        """
+        Get current statistics
+
+        Returns:
+            Status values in _STATUS_KEYS order
+        """
+        (status, rtcm_messages, bytes_broadcast, start_time, start_monotonic,
+         active_clients, gps_status) = self.base_station.collect_all()
+
+        # Wall-clock start_time is only for display; uptime uses the
+        # monotonic clock so NTP steps do not skew it or the rates
+        uptime = 0
         msg_rate = 0
         byte_rate = 0
-        if uptime > 0:
-            msg_rate = self.base_station.stats['rtcm_messages'] / uptime
-            byte_rate = self.base_station.stats['bytes_broadcast'] / uptime
+        if start_monotonic:
+            uptime = time.monotonic() - start_monotonic
+            if uptime > 0:
+                msg_rate = rtcm_messages / uptime
+                byte_rate = bytes_broadcast / uptime
 
-        # Get GPS status
-        gps_status = {'satellites': 0, 'fix_type': 'Unknown', 'hdop': 0.0, 'stale': True}
-        if self.base_station.gps:
-            gps_status = self.base_station.gps.get_gps_status()
+        return (
+            status,
+            uptime,
+            self._get_uptime_text(uptime),
+            self._get_start_iso(start_time),
+            rtcm_messages,
+            bytes_broadcast,
+            round(msg_rate, 2),
+            round(byte_rate, 2),
+            active_clients,
+            gps_status,
+            datetime.now().isoformat()
+        )
 
-        return {
-            'status': 'running' if self.base_station.running else 'stopped',
-            'uptime': uptime,
-            'uptime_formatted': str(timedelta(seconds=int(uptime))),
-            'start_time': datetime.fromtimestamp(self.base_station.stats['start_time']).isoformat() if self.base_station.stats['start_time'] else None,
-            'rtcm_messages': self.base_station.stats['rtcm_messages'],
-            'bytes_broadcast': self.base_station.stats['bytes_broadcast'],
-            'message_rate': round(msg_rate, 2),
-            'byte_rate': round(byte_rate, 2),
-            'active_clients': ntrip_stats['active_clients'],
-            'clients': ntrip_stats['clients'],
-            'gps_status': gps_status,
-            'timestamp': datetime.now().isoformat()
-        }
+    def _get_start_iso(self, start_time):
+        """Base station start time as ISO 8601 (None before it starts)"""
+        if not start_time:
+            return None
+
+        cached_for, start_iso = self._start_iso
+        if cached_for != start_time:
+            start_iso = datetime.fromtimestamp(start_time).isoformat()
+            self._start_iso = (start_time, start_iso)
+        return start_iso
+
+    def _get_uptime_text(self, uptime: float) -> str:
+        """Formatted uptime, reformatted only when the whole second changes"""
+        seconds = int(uptime)
+        cached_for, text = self._uptime_text
+        if cached_for != seconds:
+            text = self._format_uptime(seconds)
+            self._uptime_text = (seconds, text)
+        return text
+
+    @staticmethod
+    def _format_uptime(uptime: float) -> str:
+        """Format uptime as H:MM:SS (hours keep counting past a day)"""
+        minutes, seconds = divmod(int(uptime), 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+
+    def invalidate_config(self):
+        """Drop the cached /api/config response after the config changes"""
+        self._config_cache = None
 
     def _get_config_info(self):
         """Get configuration information"""
@@ -134,12 +325,26 @@ class WebInterface:
 
     def start(self):
         """Start web interface in background thread"""
+        self._stop_event.clear()
+        self._refresh_thread = Thread(target=self._status_refresher, daemon=True)
+        self._refresh_thread.start()
+
         self.server_thread = Thread(target=self._run_server, daemon=True)
         self.server_thread.start()
-        logger.info(f"Web interface started on http://{self.host}:{self.port}")
+        logger.info("Web interface started on http://%s:%d", self.host, self.port)
+
+    def stop(self):
+        """Stop the status refresher; the server thread exits with the process"""
+        self._stop_event.set()
+        if self._refresh_thread:
+            self._refresh_thread.join(timeout=2.0)
 
     def _run_server(self):
         """Run Flask server"""
+        if waitress_serve is not None:
+            waitress_serve(self.app, host=self.host, port=self.port)
+            return
+
         self.app.run(
             host=self.host,
             port=self.port,